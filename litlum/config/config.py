@@ -1,20 +1,89 @@
 """Configuration module for the LitLum application."""
 
+import copy
+import hashlib
+import logging
 import os
+import pickle
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Tuple, Union
+
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+logger = logging.getLogger(__name__)
 
 # Paths
 CONFIG_DIR = Path.home() / ".config" / "litlum"
 CONFIG_PATH = CONFIG_DIR / "config.yaml"
 DEFAULT_CONFIG_PATH = Path(__file__).parent / "default-config.yaml"
+CACHE_DIR = Path.home() / ".cache" / "litlum"
+
+# Parsed YAML files keyed by (path, mtime_ns, size)
+_YAML_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+
+def _get_pickle_cache_path(file_path: Path) -> Path:
+    """Get the path of the on-disk parse cache for a YAML file."""
+    digest = hashlib.sha1(str(file_path).encode('utf-8')).hexdigest()[:16]
+    return CACHE_DIR / f"config-{digest}.pkl"
+
+
+def _read_pickle_cache(file_path: Path, mtime_ns: int, size: int) -> Optional[Dict[str, Any]]:
+    """Read a parsed YAML file from the on-disk cache.
+
+    Returns None if there is no usable entry for this version of the file.
+    """
+    try:
+        with open(_get_pickle_cache_path(file_path), 'rb') as f:
+            entry = pickle.load(f)
+        if (entry['path'] == str(file_path) and entry['mtime_ns'] == mtime_ns
+                and entry['size'] == size):
+            return entry['config']
+    except Exception:
+        pass
+    return None
+
+
+def _write_pickle_cache(file_path: Path, mtime_ns: int, size: int, config: Dict[str, Any]) -> None:
+    """Write a parsed YAML file to the on-disk cache, ignoring failures."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_path = _get_pickle_cache_path(file_path)
+        # Per-process temporary name, so concurrent writers don't clobber each other
+        tmp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'path': str(file_path), 'mtime_ns': mtime_ns, 'size': size, 'config': config},
+                        f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        logger.debug("Could not write config cache for %s: %s", file_path, e)
 
 
 def load_yaml_config(file_path: Path) -> Dict[str, Any]:
-    """Load a YAML configuration file."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f) or {}
+    """Load a YAML configuration file.
+
+    Parsed files are cached by path, modification time and size, in memory
+    and in CACHE_DIR across runs, so loads of an unchanged file skip parsing.
+    A deep copy is returned because callers merge into the result.
+    """
+    st = os.stat(file_path)
+    if st.st_size == 0:
+        # Empty file, e.g. a user config with no overrides
+        return {}
+
+    key = (str(file_path), st.st_mtime_ns, st.st_size)
+    if key not in _YAML_CACHE:
+        config = _read_pickle_cache(file_path, st.st_mtime_ns, st.st_size)
+        if config is None:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                config = yaml.load(f, Loader=_Loader) or {}
+            _write_pickle_cache(file_path, st.st_mtime_ns, st.st_size, config)
+        _YAML_CACHE[key] = config
+    return copy.deepcopy(_YAML_CACHE[key])
 
 
 def ensure_config_dir() -> None:
@@ -30,6 +99,9 @@ def expand_path(path: Union[str, Path]) -> Path:
 class Config:
     """Configuration manager for the application."""
 
+    # Shared instances keyed by config path, see Config.instance()
+    _instances: Dict[Path, "Config"] = {}
+
     def __init__(self, config_path: Optional[Path] = None):
         """Initialize the configuration.
         
@@ -38,46 +110,57 @@ class Config:
         """
         self.config_path = config_path or CONFIG_PATH
         self._config: Dict[str, Any] = {}
+        self._flat: Dict[Tuple[str, ...], Any] = {}
+        self._ollama_config: Optional[Dict[str, Any]] = None
         self._load_config()
+        self._build_index()
+        self._resolve_storage_paths()
 
-    # Class-level flag to track if we've already printed config info
-    _config_loaded = False
+    @classmethod
+    def instance(cls, config_path: Optional[Path] = None) -> "Config":
+        """Get the shared configuration for a config file, loading it on first use.
+        
+        Args:
+            config_path: Optional path to a custom config file
+            
+        Returns:
+            Shared Config instance for the given path
+        """
+        path = config_path or CONFIG_PATH
+        if path not in cls._instances:
+            cls._instances[path] = cls(path)
+        return cls._instances[path]
 
     def _load_config(self) -> None:
         """Load configuration from file or create default."""
         # Load default config
-        if not Config._config_loaded:
-            print(f"[INFO] Loading default configuration from: {DEFAULT_CONFIG_PATH}")
+        logger.info("Loading default configuration from: %s", DEFAULT_CONFIG_PATH)
             
         try:
             self._config = load_yaml_config(DEFAULT_CONFIG_PATH)
-            if not Config._config_loaded:
-                print("[INFO] Successfully loaded default configuration")
+            logger.info("Successfully loaded default configuration")
         except Exception as e:
-            print(f"[ERROR] Failed to load default config: {e}")
+            logger.error("Failed to load default config: %s", e)
             raise RuntimeError(f"Failed to load default config: {e}")
         
         # Load user config if it exists
         if self.config_path.exists():
-            if not Config._config_loaded:
-                print(f"[INFO] Loading user configuration from: {self.config_path}")
+            logger.info("Loading user configuration from: %s", self.config_path)
             try:
                 user_config = load_yaml_config(self.config_path)
                 self._update_config(user_config)
-                if not Config._config_loaded:
-                    print("[INFO] Successfully loaded user configuration")
+                logger.info("Successfully loaded user configuration")
             except Exception as e:
-                if not Config._config_loaded:
-                    print(f"[WARNING] Failed to load user config: {e}. Using default configuration.")
-        elif not Config._config_loaded:
-            print(f"[INFO] No user configuration found at {self.config_path}. Using default configuration.")
-        
-        # Mark config as loaded after first successful load
-        Config._config_loaded = True
+                logger.warning("Failed to load user config: %s. Using default configuration.", e)
+        else:
+            logger.info("No user configuration found at %s. Using default configuration.", self.config_path)
 
     def _update_config(self, new_config: Dict[str, Any], target: Optional[Dict[str, Any]] = None) -> None:
         """Recursively update the configuration.
         
+        Nested dictionaries are merged key by key, walking the tree with an
+        explicit stack rather than recursive calls.
+        
         Args:
             new_config: New configuration values to apply
             target: The target dictionary to update (defaults to self._config)
@@ -85,70 +168,108 @@ class Config:
         if target is None:
             target = self._config
             
-        for key, value in new_config.items():
-            if key in target and isinstance(target[key], dict) and isinstance(value, dict):
-                self._update_config(value, target[key])
-            else:
-                target[key] = value
+        stack = [(target, new_config)]
+        while stack:
+            target, new_config = stack.pop()
+            for key, value in new_config.items():
+                if key in target and isinstance(target[key], dict) and isinstance(value, dict):
+                    stack.append((target[key], value))
+                else:
+                    target[key] = value
+        
+        self._build_index()
+        self._resolve_storage_paths()
+
+    def _build_index(self) -> None:
+        """Index every config value by its key path for constant-time Config.get lookups."""
+        flat: Dict[Tuple[str, ...], Any] = {(): self._config}
+        stack = [((), self._config)]
+        while stack:
+            prefix, section = stack.pop()
+            for key, value in section.items():
+                path = prefix + (key,)
+                flat[path] = value
+                if isinstance(value, dict):
+                    stack.append((path, value))
+        self._flat = flat
+        self._ollama_config = None
+        # Interests are read-only for callers and joined once for prompt formatting
+        self._interests = tuple(flat.get(("interests",)) or ())
+        self._interests_joined = ", ".join(self._interests)
 
     def get(self, *keys: str, default: Any = None) -> Any:
         """Get a nested config value by dot notation."""
-        value = self._config
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return default
-        return value
+        return self._flat.get(keys, default)
 
     def get_database_path(self) -> Path:
         """Get database path, expanding the user home directory."""
+        return self._database_path
+
+    def get_feed_cache_path(self) -> Path:
+        """Get the path of the CrossRef response cache file."""
+        return self._feed_cache_path
+
+    def get_llm_cache_path(self) -> Path:
+        """Get the path of the LLM response cache database."""
+        return self._llm_cache_path
+
+    def _resolve_storage_paths(self) -> None:
+        """Resolve the database, cache, reports and web paths from the environment or config."""
         db_path = self.get("database", "path") or "~/.local/share/litlum/litlum.db"
-        return expand_path(db_path)
+        self._database_path = expand_path(db_path)
+        
+        cache_path = self.get("crossref", "cache_path") or "~/.local/share/litlum/crossref-cache.db"
+        self._feed_cache_path = expand_path(cache_path)
+        
+        llm_cache_path = self.get("ollama", "cache_path") or "~/.local/share/litlum/llm-cache.db"
+        self._llm_cache_path = expand_path(llm_cache_path)
+        
+        # Environment variables take precedence over the config file
+        if os.environ.get('LITLUM_REPORTS_DIR'):
+            self._reports_path = Path(os.environ['LITLUM_REPORTS_DIR'])
+        else:
+            reports_path = self.get("storage", "reports") or "~/.local/share/litlum/reports"
+            self._reports_path = expand_path(reports_path)
+        
+        if os.environ.get('LITLUM_WEB_DIR'):
+            self._web_path = Path(os.environ['LITLUM_WEB_DIR'])
+        else:
+            web_path = self.get("storage", "web") or "~/.local/share/litlum/web"
+            self._web_path = expand_path(web_path)
 
     def get_reports_path(self) -> Path:
         """Get the path for storing reports."""
-        # First check if environment variable is set
-        if os.environ.get('LITLUM_REPORTS_DIR'):
-            return Path(os.environ['LITLUM_REPORTS_DIR'])
-        # Then check config file
-        reports_path = self.get("storage", "reports") or "~/.local/share/litlum/reports"
-        return expand_path(reports_path)
+        return self._reports_path
 
     def get_web_path(self) -> Path:
         """Get the path for the static website."""
-        # First check if environment variable is set
-        if os.environ.get('LITLUM_WEB_DIR'):
-            return Path(os.environ['LITLUM_WEB_DIR'])
-        # Then check config file
-        web_path = self.get("storage", "web") or "~/.local/share/litlum/web"
-        return expand_path(web_path)
+        return self._web_path
 
     def get_ollama_config(self) -> Dict[str, Any]:
-        """Get Ollama LLM configuration with interests formatted into prompts."""
-        ollama_config = self.get("ollama") or {}
-        interests = self.get("interests") or []
+        """Get Ollama LLM configuration with interests formatted into prompts.
         
-        # Format prompts with interests if they contain {interests} placeholder
-        if "system_prompt" in ollama_config and "{interests}" in ollama_config["system_prompt"]:
-            ollama_config["system_prompt"] = ollama_config["system_prompt"].format(
-                interests=", ".join(interests)
-            )
+        The formatted configuration is built once per config state and
+        leaves the underlying config untouched.
+        """
+        if self._ollama_config is None:
+            ollama_config = dict(self.get("ollama") or {})
+            ollama_config["interests"] = list(self._interests)
             
-        if "relevance_prompt" in ollama_config and "{interests}" in ollama_config["relevance_prompt"]:
-            ollama_config["relevance_prompt"] = ollama_config["relevance_prompt"].format(
-                interests=", ".join(interests)
-            )
+            # Format prompts with interests if they contain {interests} placeholder
+            for key in ("system_prompt", "relevance_prompt"):
+                if key in ollama_config and "{interests}" in ollama_config[key]:
+                    ollama_config[key] = ollama_config[key].format(interests=self._interests_joined)
             
-        return ollama_config
+            self._ollama_config = ollama_config
+        return self._ollama_config
 
     def get_feeds(self) -> List[Dict[str, Any]]:
         """Get configured RSS feeds."""
         return self.get("feeds") or []
 
-    def get_interests(self) -> List[str]:
-        """Get the list of interests for determining publication relevance."""
-        return self.get("interests") or []
+    def get_interests(self) -> Tuple[str, ...]:
+        """Get the interests for determining publication relevance."""
+        return self._interests
 
     def get_min_relevance(self) -> float:
         """Get the minimum relevance threshold for reports."""
@@ -158,4 +279,4 @@ class Config:
         """Save current configuration to file."""
         ensure_config_dir()
         with open(self.config_path, 'w', encoding='utf-8') as f:
-            yaml.dump(self._config, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(self._config, f, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
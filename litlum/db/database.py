@@ -3,7 +3,7 @@
 import sqlite3
 import os
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterator, List, Optional, Any, Set, Tuple
 from pathlib import Path
 
 
@@ -34,6 +34,13 @@ class Database:
         """
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
+        
+        # WAL keeps commits cheap; NORMAL sync is safe in WAL mode
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-65536')  # 64 MiB
+        conn.execute('PRAGMA mmap_size=268435456')  # 256 MiB
         return conn
     
     def _create_tables(self) -> None:
@@ -67,6 +74,18 @@ class Database:
         )
         ''')
         
+        # Indexes for the unprocessed and date-range publication queries. The
+        # partial index serves both unprocessed queries, with and without a date
+        cursor.execute('DROP INDEX IF EXISTS idx_pub_relevance_null')
+        cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_pub_processed_date
+        ON publications(processed_date)
+        ''')
+        cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_pub_date_unproc
+        ON publications(processed_date) WHERE relevance_score IS NULL
+        ''')
+        
         self.conn.commit()
     
     def add_publication(self, publication: Dict[str, Any]) -> int:
@@ -99,6 +118,40 @@ class Database:
             # Publication already exists
             return -1
     
+    def add_publications(self, publications: List[Dict[str, Any]]) -> int:
+        """Add several publications to the database in a single transaction.
+        
+        Publications that already exist are skipped.
+        
+        Args:
+            publications: List of dictionaries containing publication details
+            
+        Returns:
+            Number of newly inserted publications
+        """
+        processed_date = datetime.now().isoformat()
+        rows = [
+            (
+                publication.get('journal', ''),
+                publication.get('title', ''),
+                publication.get('abstract', ''),
+                publication.get('url', ''),
+                publication.get('pub_date', ''),
+                publication.get('guid', ''),
+                processed_date
+            )
+            for publication in publications
+        ]
+        
+        changes_before = self.conn.total_changes
+        with self.conn:
+            self.conn.executemany('''
+            INSERT OR IGNORE INTO publications
+            (journal, title, abstract, url, pub_date, guid, processed_date)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+        return self.conn.total_changes - changes_before
+    
     def update_publication_analysis(self, pub_id: int, relevance_score: int, summary: str) -> None:
         """Update a publication with LLM analysis results.
         
@@ -115,6 +168,19 @@ class Database:
         ''', (relevance_score, summary, pub_id))
         self.conn.commit()
     
+    def update_publications_analysis(self, updates: List[Tuple[int, int, str]]) -> None:
+        """Update several publications with LLM analysis results in a single transaction.
+        
+        Args:
+            updates: List of (publication ID, relevance score, summary) tuples
+        """
+        with self.conn:
+            self.conn.executemany('''
+            UPDATE publications
+            SET relevance_score = ?, llm_summary = ?
+            WHERE id = ?
+            ''', [(relevance_score, summary, pub_id) for pub_id, relevance_score, summary in updates])
+    
     def get_unprocessed_publications(self) -> List[Dict[str, Any]]:
         """Get publications that haven't been processed by the LLM.
         
@@ -129,6 +195,50 @@ class Database:
         ''')
         return [dict(row) for row in cursor.fetchall()]
     
+    def get_unprocessed_publications_by_date(self, date: str) -> List[Dict[str, Any]]:
+        """Get publications processed on a specific date that haven't been analyzed by the LLM.
+        
+        Args:
+            date: Date string in ISO format (YYYY-MM-DD)
+            
+        Returns:
+            List of publication dictionaries
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('''
+        SELECT id, journal, title, abstract, url, pub_date, guid
+        FROM publications
+        WHERE processed_date >= ? AND processed_date < date(?, '+1 day')
+        AND relevance_score IS NULL
+        ''', (date, date))
+        return [dict(row) for row in cursor.fetchall()]
+    
+    def count_publications(self) -> int:
+        """Count all stored publications.
+        
+        Returns:
+            Number of publications
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('SELECT COUNT(*) FROM publications')
+        return cursor.fetchone()[0]
+    
+    def iter_publications(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over all stored publications.
+        
+        Rows are fetched from SQLite as the iterator is consumed.
+        
+        Yields:
+            Publication dictionaries
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('''
+        SELECT id, journal, title, abstract, url, pub_date, guid
+        FROM publications
+        ''')
+        for row in cursor:
+            yield dict(row)
+    
     def get_publications_by_date(self, date: str, min_relevance: int = 0) -> List[Dict[str, Any]]:
         """Get publications processed on a specific date with minimum relevance score.
         
@@ -143,10 +253,10 @@ class Database:
         cursor.execute('''
         SELECT id, journal, title, abstract, url, pub_date, guid, relevance_score, llm_summary
         FROM publications
-        WHERE date(processed_date) = ?
+        WHERE processed_date >= ? AND processed_date < date(?, '+1 day')
         AND (relevance_score IS NULL OR relevance_score >= ?)
         ORDER BY relevance_score DESC
-        ''', (date, min_relevance))
+        ''', (date, date, min_relevance))
         return [dict(row) for row in cursor.fetchall()]
     
     def get_recent_publications(self, days: int = 1, min_relevance: int = 0) -> List[Dict[str, Any]]:
@@ -159,18 +269,32 @@ class Database:
         Returns:
             List of publication dictionaries
         """
+        return [dict(row) for row in self.iter_recent_publications(days, min_relevance)]
+    
+    def iter_recent_publications(self, days: int = 1, min_relevance: int = 0) -> Iterator[sqlite3.Row]:
+        """Iterate over recent publications from the last N days with minimum relevance score.
+        
+        Rows are fetched from SQLite as the iterator is consumed.
+        
+        Args:
+            days: Number of days to look back
+            min_relevance: Minimum relevance score (0-10)
+            
+        Yields:
+            Publication rows
+        """
         cursor = self.conn.cursor()
         cursor.execute('''
         SELECT id, journal, title, abstract, url, pub_date, guid, relevance_score, llm_summary
         FROM publications
-        WHERE date(processed_date) >= date('now', ? || ' days')
+        WHERE processed_date >= date('now', ? || ' days')
         AND (relevance_score IS NULL OR relevance_score >= ?)
         ORDER BY 
             CASE WHEN relevance_score IS NULL THEN 1 ELSE 0 END,
             relevance_score DESC,
             pub_date DESC
         ''', (f'-{days}', min_relevance))
-        return [dict(row) for row in cursor.fetchall()]
+        yield from cursor
     
     def save_daily_summary(self, date: str, summary: str) -> int:
         """Save a daily summary to the database.
@@ -182,13 +306,14 @@ class Database:
         Returns:
             ID of the inserted summary
         """
+        created_at = datetime.now().isoformat()
         cursor = self.conn.cursor()
         try:
             cursor.execute('''
             INSERT INTO daily_summaries 
             (date, summary, created_at)
             VALUES (?, ?, ?)
-            ''', (date, summary, datetime.now().isoformat()))
+            ''', (date, summary, created_at))
             self.conn.commit()
             return cursor.lastrowid
         except sqlite3.IntegrityError:
@@ -197,7 +322,7 @@ class Database:
             UPDATE daily_summaries
             SET summary = ?, created_at = ?
             WHERE date = ?
-            ''', (summary, datetime.now().isoformat(), date))
+            ''', (summary, created_at, date))
             self.conn.commit()
             return cursor.lastrowid
     
@@ -219,6 +344,24 @@ class Database:
         row = cursor.fetchone()
         return dict(row) if row else None
     
+    def get_publication(self, pub_id: int) -> Optional[Dict[str, Any]]:
+        """Get a publication by its ID.
+        
+        Args:
+            pub_id: Publication ID
+            
+        Returns:
+            Publication dictionary or None if not found
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('''
+        SELECT id, journal, title, abstract, url, pub_date, guid, relevance_score, llm_summary
+        FROM publications
+        WHERE id = ?
+        ''', (pub_id,))
+        row = cursor.fetchone()
+        return dict(row) if row else None
+    
     def get_publication_by_guid(self, guid: str) -> Optional[Dict[str, Any]]:
         """Get a publication by its GUID.
         
@@ -237,6 +380,16 @@ class Database:
         row = cursor.fetchone()
         return dict(row) if row else None
     
+    def get_publication_guids(self) -> Set[str]:
+        """Get the GUIDs of all stored publications.
+        
+        Returns:
+            Set of publication GUIDs
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('SELECT guid FROM publications')
+        return {row[0] for row in cursor}
+    
     def close(self) -> None:
         """Close the database connection."""
         if self.conn:
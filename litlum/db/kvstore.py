@@ -0,0 +1,56 @@
+"""Small SQLite key-value store backing the on-disk response caches."""
+
+import os
+import sqlite3
+import threading
+from typing import Optional, Union
+
+Key = Union[str, bytes]
+
+
+class KeyValueStore:
+    """SQLite table of text values by key, safe to share between threads."""
+
+    def __init__(self, path: str):
+        """Open (and create if needed) the store.
+
+        Args:
+            path: Path to the SQLite file
+        """
+        self.path = os.path.expanduser(path)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._lock = threading.Lock()
+        # Callers work from thread pools, so one connection is shared under a lock
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS kv (key PRIMARY KEY, value TEXT NOT NULL)')
+        self.conn.commit()
+
+    def get(self, key: Key) -> Optional[str]:
+        """Get a value.
+
+        Args:
+            key: Key to look up
+
+        Returns:
+            Stored value, or None if there is none
+        """
+        with self._lock:
+            row = self.conn.execute('SELECT value FROM kv WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: Key, value: str) -> None:
+        """Store a value, replacing any previous one.
+
+        Args:
+            key: Key to store under
+            value: Value text
+        """
+        with self._lock:
+            with self.conn:
+                self.conn.execute('INSERT OR REPLACE INTO kv (key, value) VALUES (?, ?)', (key, value))
+
+    def close(self) -> None:
+        """Close the store."""
+        self.conn.close()
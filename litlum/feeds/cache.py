@@ -0,0 +1,58 @@
+"""On-disk cache of CrossRef responses for conditional HTTP requests."""
+
+import json
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+from ..db.kvstore import KeyValueStore
+
+
+class FeedCache:
+    """SQLite cache of CrossRef responses and their validators (ETag, Last-Modified)."""
+
+    def __init__(self, cache_path: str):
+        """Initialize the feed cache.
+
+        Args:
+            cache_path: Path to the SQLite cache file
+        """
+        self.store = KeyValueStore(cache_path)
+        self.cache_path = self.store.path
+
+    def get(self, key: str, url: str) -> Optional[Dict[str, Any]]:
+        """Get the cached response for a feed.
+
+        Args:
+            key: Feed key (one entry is kept per key)
+            url: Request URL the cached response must belong to
+
+        Returns:
+            Cache entry with etag, last_modified and body, or None if not cached
+        """
+        value = self.store.get(key)
+        if value is None:
+            return None
+        entry = json.loads(value)
+        return entry if entry.get('url') == url else None
+
+    def put(self, key: str, url: str, etag: Optional[str], last_modified: Optional[str], body: str) -> None:
+        """Store a response for a feed.
+
+        Args:
+            key: Feed key (replaces any previous entry for it)
+            url: Request URL
+            etag: ETag response header
+            last_modified: Last-Modified response header
+            body: Response body text
+        """
+        self.store.put(key, json.dumps({
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'body': body,
+            'fetched_at': datetime.now().isoformat()
+        }))
+
+    def close(self) -> None:
+        """Close the cache database."""
+        self.store.close()
@@ -1,29 +1,108 @@
 """CrossRef API parser for scientific publications."""
 
+import calendar
+import functools
+import re
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
-from urllib.parse import quote
+from typing import Dict, Iterator, List, Any, Optional, Set, Tuple
+from urllib.parse import urlencode
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from ..config import Config
+from .cache import FeedCache
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Title keywords marking non-research content like issue information, tables of contents, etc.
+NON_RESEARCH_KEYWORDS = [
+    'issue information', 'table of contents', 'cover image', 
+    'editorial board', 'masthead', 'editor', 'front matter',
+    'back matter', 'volume information', 'errata', 'correction'
+]
+_NON_RESEARCH_RE = re.compile(
+    "|".join(re.escape(keyword) for keyword in NON_RESEARCH_KEYWORDS), re.IGNORECASE
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_non_research_title(title: str) -> bool:
+    """Check whether a title marks non-research content (cached, titles recur across runs)."""
+    return _NON_RESEARCH_RE.search(title) is not None
+
+
+@functools.lru_cache(maxsize=1024)
+def _iso_from_date_parts(date_parts: Tuple[int, ...]) -> Optional[str]:
+    """Convert CrossRef date-parts to an ISO date string (cached, dates repeat across items).
+    
+    Args:
+        date_parts: (year[, month[, day]]) tuple
+        
+    Returns:
+        ISO format date string, or None if the parts do not form a valid date
+    """
+    # Missing month/day default to the first, as CrossRef gives partial dates
+    year, month, day = (list(date_parts[:3]) + [1, 1])[:3]
+    if 1 <= year <= 9999 and 1 <= month <= 12 and 1 <= day <= calendar.monthrange(year, month)[1]:
+        return f"{year:04d}-{month:02d}-{day:02d}T00:00:00"
+    return None
+
+
+# Maximum number of feeds fetched concurrently by FeedParser.parse_feeds
+MAX_FETCH_WORKERS = 8
+
+# CrossRef page size and default cap on results fetched per feed
+ROWS_PER_PAGE = 100
+DEFAULT_MAX_RESULTS = 1000
+
+
+def _create_session() -> requests.Session:
+    """Create an HTTP session with a connection pool for the CrossRef API.
+    
+    Transient gateway errors are retried with a short backoff on the pooled
+    connections instead of failing the whole feed. Connection errors are not
+    retried, so an unreachable API fails fast.
+    """
+    session = requests.Session()
+    retries = Retry(total=3, connect=0, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 class FeedParser:
     """Parser for scientific publications using CrossRef API."""
     
-    def __init__(self, current_date=None):
+    base_url = "https://api.crossref.org/works"
+    user_agent = "PublicationReader/1.0 (mailto:you@awi.de)"  # Replace with your email
+    headers = {"User-Agent": user_agent}
+    
+    # Shared session so connections to CrossRef are kept alive between requests
+    _session = _create_session()
+    
+    def __init__(self, config: Optional[Config] = None, current_date=None,
+                 cache: Optional[FeedCache] = None):
         """Initialize the feed parser.
         
         Args:
+            config: Optional Config to use, defaults to the shared instance
             current_date: Optional datetime to use as current date (for testing)
+            cache: Optional FeedCache for conditional requests, disabled if None
         """
-        self.base_url = "https://api.crossref.org/works"
-        self.user_agent = "PublicationReader/1.0 (mailto:you@awi.de)"  # Replace with your email
-        self.config_manager = Config()
-        # Don't call _load_config() here as it's already called in Config.__init__
-        # and stores the config in self._config
+        self.config_manager = config or Config.instance()
         self.config = self.config_manager._config
         self._current_date = current_date or datetime.now()
+        # Publication date used for items without one, formatted once per parser
+        self._fallback_pub_date = self._current_date.isoformat()
+        self.cache = cache
+        # GUIDs of publications already stored, these are skipped during extraction
+        self.known_guids: Set[str] = set()
     
     def parse_feed(self, feed_config: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Parse publications from CrossRef API based on ISSN.
@@ -47,30 +126,143 @@ class FeedParser:
             days_range = feed_config.get('days_range', global_days_range)
             from_date = (self._current_date - timedelta(days=days_range)).strftime("%Y-%m-%d")
             
-            # Construct the API URL
-            filter_params = f"issn:{issn},from-pub-date:{from_date},has-abstract:true"
-            url = f"{self.base_url}?filter={quote(filter_params)}&select=DOI,title,abstract&sort=published&order=desc&rows=100"
-            
-            # Make the request
-            headers = {"User-Agent": self.user_agent}
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
+            max_results = self.config.get('crossref', {}).get('max_results', DEFAULT_MAX_RESULTS)
             
-            data = response.json()
+            # Construct the API query, requests takes care of the URL encoding
+            params = {
+                'filter': f"issn:{issn},from-pub-date:{from_date},has-abstract:true",
+                'select': "DOI,title,abstract",
+                'sort': "published",
+                'order': "desc",
+                'rows': ROWS_PER_PAGE
+            }
             
-            # Extract and format publications
+            # Page through the results with CrossRef's deep paging cursor
             publications = []
-            if 'message' in data and 'items' in data['message']:
-                for item in data['message']['items']:
+            cursor = "*"
+            fetched = 0
+            # Only the first page has a stable URL worth revalidating
+            cache_key = f"{issn}:{days_range}"
+            first_page_entry = None
+            complete = False
+            while fetched < max_results:
+                try:
+                    data, not_modified, cache_entry = self._get_json(
+                        dict(params, cursor=cursor), cache_key if cursor == "*" else None
+                    )
+                except Exception as e:
+                    # Keep the pages fetched before the failure
+                    print(f"Error fetching CrossRef data for {journal_name} (ISSN: {issn}): {str(e)}")
+                    break
+                if cursor == "*":
+                    first_page_entry = cache_entry
+                message = data.get('message', {})
+                items = message.get('items', [])
+                
+                # Extract and format publications
+                for item in items:
                     publication = self._extract_publication_data(item, journal_name)
                     if publication:
                         publications.append(publication)
+                
+                fetched += len(items)
+                cursor = message.get('next-cursor')
+                # An unchanged first page means the later pages were fetched on an
+                # earlier run, and its cached next-cursor has long expired
+                if not_modified or len(items) < ROWS_PER_PAGE or not cursor:
+                    complete = True
+                    break
+            
+            # Cache the first page only once every page was fetched, otherwise a
+            # 304 on the next run would skip the pages that are still missing
+            if complete and first_page_entry is not None:
+                self.cache.put(cache_key, **first_page_entry)
             
             return publications
         except Exception as e:
             print(f"Error fetching CrossRef data for {journal_name} (ISSN: {issn}): {str(e)}")
             return []
     
+    def _get_json(self, params: Dict[str, Any], cache_key: Optional[str] = None
+                  ) -> Tuple[Dict[str, Any], bool, Optional[Dict[str, Any]]]:
+        """Fetch and decode a CrossRef API response.
+        
+        The response is not stored in the cache here; callers store the
+        returned cache entry once they know the response is worth keeping.
+        
+        Args:
+            params: Query parameters for the works endpoint
+            cache_key: Key to revalidate a cached response under, or None to skip the cache
+            
+        Returns:
+            Tuple of (decoded JSON response, whether it is an unchanged cached
+            response, FeedCache.put arguments for a new cacheable response or None)
+        """
+        # Make the request, revalidating a cached response if we have one
+        headers = self.headers
+        use_cache = self.cache is not None and cache_key is not None
+        cached = None
+        if use_cache:
+            url = f"{self.base_url}?{urlencode(params)}"
+            cached = self.cache.get(cache_key, url)
+        if cached:
+            headers = dict(self.headers)
+            if cached.get('etag'):
+                headers["If-None-Match"] = cached['etag']
+            if cached.get('last_modified'):
+                headers["If-Modified-Since"] = cached['last_modified']
+        
+        response = self._session.get(self.base_url, params=params, headers=headers)
+        
+        if cached and response.status_code == 304:
+            # Not modified, reuse the cached body
+            return _json_loads(cached['body']), True, None
+        
+        response.raise_for_status()
+        data = _json_loads(response.content)
+        
+        cache_entry = None
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if use_cache and (etag or last_modified):
+            cache_entry = {'url': url, 'etag': etag, 'last_modified': last_modified, 'body': response.text}
+        
+        return data, False, cache_entry
+    
+    def parse_feeds(self, feed_configs: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Parse several feeds concurrently.
+        
+        Args:
+            feed_configs: List of feed configuration dictionaries
+            
+        Returns:
+            List of publication lists, in the same order as feed_configs
+        """
+        if not feed_configs:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(feed_configs))) as executor:
+            return list(executor.map(self.parse_feed, feed_configs))
+    
+    def iter_parsed_feeds(self, feed_configs: List[Dict[str, Any]]
+                          ) -> Iterator[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """Parse several feeds concurrently, yielding each one as soon as it is done.
+        
+        Args:
+            feed_configs: List of feed configuration dictionaries
+            
+        Yields:
+            Tuples of (feed configuration, list of publications) in completion order
+        """
+        if not feed_configs:
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(feed_configs))) as executor:
+            futures = {executor.submit(self.parse_feed, feed_config): feed_config
+                       for feed_config in feed_configs}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+    
     def _extract_publication_data(self, item: Dict[str, Any], journal_name: str) -> Optional[Dict[str, Any]]:
         """Extract publication data from a CrossRef API item.
         
@@ -86,6 +278,11 @@ class FeedParser:
         if not doi:
             return None
         
+        # Create a unique GUID using the DOI
+        guid = f"crossref-{doi}"
+        if guid in self.known_guids:
+            return None
+        
         # Extract title
         title = ""
         if 'title' in item and item['title']:
@@ -95,14 +292,7 @@ class FeedParser:
             return None
         
         # Filter out non-research content like issue information, tables of contents, etc.
-        non_research_keywords = [
-            'issue information', 'table of contents', 'cover image', 
-            'editorial board', 'masthead', 'editor', 'front matter',
-            'back matter', 'volume information', 'errata', 'correction'
-        ]
-        
-        # Check if the title contains any of the non-research keywords
-        if any(keyword.lower() in title.lower() for keyword in non_research_keywords):
+        if _is_non_research_title(title):
             return None
         
         # Extract abstract
@@ -116,9 +306,6 @@ class FeedParser:
         # Extract publication date
         pub_date = self._extract_pub_date(item)
         
-        # Create a unique GUID using the DOI
-        guid = f"crossref-{doi}"
-        
         return {
             'journal': journal_name,
             'title': title,
@@ -143,17 +330,12 @@ class FeedParser:
                 published = item['published']
                 if 'date-parts' in published and published['date-parts']:
                     date_parts = published['date-parts'][0]
-                    if len(date_parts) >= 3:
-                        year, month, day = date_parts[:3]
-                        return datetime(year, month, day).isoformat()
-                    elif len(date_parts) == 2:
-                        year, month = date_parts
-                        return datetime(year, month, 1).isoformat()
-                    elif len(date_parts) == 1:
-                        year = date_parts[0]
-                        return datetime(year, 1, 1).isoformat()
+                    if date_parts:
+                        pub_date = _iso_from_date_parts(tuple(date_parts))
+                        if pub_date:
+                            return pub_date
         except Exception as e:
             print(f"Error parsing date from CrossRef item: {str(e)}")
         
-        # Default to current time if no date found
-        return datetime.now().isoformat()
+        # Default to the parser's current time if no date found
+        return self._fallback_pub_date
@@ -1,15 +1,23 @@
 """Ollama LLM integration for publication analysis."""
 
+import hashlib
 import re
 import ollama
-from typing import Dict, Any, Tuple, Optional
-import os
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from typing import Dict, Any, Iterable, Iterator, List, Tuple, Optional
 from rich.console import Console
 from rich.panel import Panel
-from rich.syntax import Syntax
 from rich.text import Text
 from rich.theme import Theme
 
+from .cache import ResponseCache
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 # Custom theme for consistent styling
 ANALYZER_THEME = Theme({
     "info": "cyan",
@@ -25,23 +33,94 @@ ANALYZER_THEME = Theme({
 
 console = Console(theme=ANALYZER_THEME)
 
+# Number of recent analysis results kept to answer duplicate publications
+DUPLICATE_RESULTS_SIZE = 1024
+
+# Prompts used when the config leaves them empty
+DEFAULT_RELEVANCE_PROMPT = (
+    "Analyze this scientific publication and determine if it's relevant. "
+    "Rate relevance from 0-10 and explain why."
+)
+DEFAULT_SUMMARY_PROMPT = (
+    "Create a concise summary of this scientific publication highlighting key findings and methodology."
+)
+
+# Relevance score patterns for free-text replies, tried in order (models format scores differently)
+_RELEVANCE_PATTERNS = (
+    # Standard N/10 format
+    re.compile(r'\b([0-9]|10)\s*\/\s*10\b'),
+    # Formats like "Relevance: 7" or "Score is 7" or "Rating: 7"
+    re.compile(r'(?:relevance|score|rating)\s*(?:is|:)\s*([0-9]|10)\b', re.IGNORECASE),
+    # A number somewhere after the word "score" or similar
+    re.compile(r'(?:score|rating|relevance).*?([0-9]|10)\b', re.IGNORECASE),
+    # Last resort - any number between 0-10
+    re.compile(r'\b([0-9]|10)\b'),
+)
+_EXPLANATION_RE = re.compile(r'(?:explanation|because|as)[:.]?\s*(.+)', re.IGNORECASE | re.DOTALL)
+
+# Patterns used by OllamaAnalyzer._extract_relevance_score
+_SCORE_PATTERNS = (
+    re.compile(r'relevance:?\s*(\d+)(?:/10)?', re.IGNORECASE),
+    re.compile(r'score:?\s*(\d+)(?:/10)?', re.IGNORECASE),
+    re.compile(r'rating:?\s*(\d+)(?:/10)?', re.IGNORECASE),
+    re.compile(r'(\d+)/10', re.IGNORECASE),
+)
+_POSITIVE_TERMS = frozenset({'relevant', 'interesting', 'important', 'significant', 'novel'})
+_NEGATIVE_TERMS = frozenset({'irrelevant', 'not relevant', 'unrelated', 'not aligned'})
+# Lookahead so overlapping terms ("relevant" inside "irrelevant") are all found in one pass
+_SENTIMENT_TERMS_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(term) for term in _POSITIVE_TERMS | _NEGATIVE_TERMS) + '))'
+)
+
 
 class OllamaAnalyzer:
     """Publication analyzer using Ollama LLM."""
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], cache: Optional[ResponseCache] = None):
         """Initialize the analyzer.
         
         Args:
             config: Ollama configuration dictionary
+            cache: Optional cache of LLM responses, reused for identical requests
         """
         self.model = config.get('model', 'llama3.2')
         self.host = config.get('host', 'http://localhost:11434')
-        self.relevance_prompt = config.get('relevance_prompt', '')
-        self.summary_prompt = config.get('summary_prompt', '')
+        self.relevance_prompt = config.get('relevance_prompt') or DEFAULT_RELEVANCE_PROMPT
+        self.summary_prompt = config.get('summary_prompt') or DEFAULT_SUMMARY_PROMPT
+        self.concurrency = max(1, int(config.get('concurrency', 4)))
+        # Abstracts shorter than this are too thin to score and skip the LLM
+        self.min_abstract_chars = int(config.get('min_abstract_chars', 0))
+        # Optional keyword gate: skip the LLM for papers sharing no word with the interests
+        self.prefilter = bool(config.get('prefilter', False))
+        self._interest_re = self._compile_interest_pattern(config.get('interests') or [])
+        # Print full prompts, responses and score matches
+        self.debug = bool(config.get('debug', False))
+        # Cap on generated tokens per reply; answers are a score and a sentence or two
+        self.num_predict = int(config.get('num_predict', 256))
+        # Keep the model (and its prompt cache) loaded between requests
+        self.keep_alive = config.get('keep_alive', '30m')
+        self.cache = cache
+        # Set to False to skip cached replies (e.g. when reanalyzing); replies are still stored
+        self.read_cache = True
+        
+        # Fixed instructions go into system messages built once; user messages
+        # carry only the per-publication text
+        self._summary_system = self._create_summary_system_prompt()
+        self._combined_system = self._create_combined_system_prompt()
         
-        # Set environment variable for Ollama host
-        os.environ['OLLAMA_HOST'] = self.host
+        # One client for all requests, so worker threads share its connection pool
+        self.client = ollama.Client(host=self.host)
+    
+    def warm_up(self) -> None:
+        """Load the model into Ollama ahead of the first analysis request.
+        
+        An empty generate request loads the model without decoding anything,
+        and keep_alive keeps it resident for the requests that follow.
+        """
+        try:
+            self.client.generate(model=self.model, prompt='', keep_alive=self.keep_alive or None)
+        except Exception as e:
+            console.print(f"[bold yellow]Could not preload model {self.model}:[/] {str(e)}")
     
     def analyze_publication(self, publication: Dict[str, Any]) -> Tuple[int, str]:
         """Analyze a publication to determine relevance and generate a summary.
@@ -59,32 +138,219 @@ class OllamaAnalyzer:
         if not title or not abstract:
             return 0, "Insufficient data for analysis"
         
-        # Print paper header
-        console.print(f"\n{'='*80}")
-        console.print(f"[bold blue]PAPER:[/] {title}")
-        console.print(f"[bold blue]JOURNAL:[/] {journal}")
-        
-        # Get relevance score
-        relevance_score, relevance_text = self._determine_relevance(title, abstract)
-        
-        # Generate summary based on relevance score
-        if relevance_score >= 7:  # Highly relevant
-            summary = self._generate_summary(title, abstract, journal, relevance_score, relevance_text)
-            console.print("[bold green]✓ Analysis complete - High Relevance[/]")
-        elif relevance_score >= 5:  # Moderately relevant
-            summary = self._generate_summary(title, abstract, journal, relevance_score, relevance_text, detailed=False)
-            console.print("[bold yellow]✓ Analysis complete - Moderate Relevance[/]")
-        else:  # Low relevance
-            console.print(f"[bold red]✗ Skipping detailed analysis - Low Relevance ({relevance_score}/10)[/]")
-            summary = (
-                f"## ⚠️ Low Relevance Analysis\n\n"
-                f"This publication has a relevance score of [bold red]{relevance_score}/10[/].\n\n"
-                f"**Reason for low relevance:** {relevance_text}\n\n"
-                f"No detailed summary was generated due to low relevance score."
+        if len(abstract) < self.min_abstract_chars:
+            return 0, "Insufficient abstract for reliable scoring"
+        
+        if self.prefilter and self._interest_re and not self._interest_re.search(f"{title} {abstract}"):
+            return 0, (
+                "## ⚠️ Low Relevance Analysis\n\n"
+                "This publication shares no keywords with the configured interests and was not sent to the LLM."
             )
         
+        # Analyses run on worker threads; buffer this publication's output
+        # (the buffer is per thread) and write it in one piece on exit
+        with console:
+            # Print paper header
+            console.print(f"\n{'='*80}")
+            console.print(f"[bold blue]PAPER:[/] {title}")
+            console.print(f"[bold blue]JOURNAL:[/] {journal}")
+            
+            # Score and summarize with a single structured request, falling back to
+            # separate relevance and summary requests if the reply isn't usable JSON
+            combined = self._analyze_combined(title, abstract, journal)
+            if combined is not None:
+                relevance_score, relevance_text, summary = combined
+            else:
+                relevance_score, relevance_text = self._determine_relevance(title, abstract)
+                summary = None
+            
+            # Generate summary based on relevance score
+            if relevance_score >= 7:  # Highly relevant
+                if not summary:
+                    summary = self._generate_summary(title, abstract, journal, relevance_score, relevance_text)
+                console.print("[bold green]✓ Analysis complete - High Relevance[/]")
+            elif relevance_score >= 5:  # Moderately relevant
+                if not summary:
+                    summary = self._generate_summary(title, abstract, journal, relevance_score, relevance_text, detailed=False)
+                console.print("[bold yellow]✓ Analysis complete - Moderate Relevance[/]")
+            else:  # Low relevance
+                console.print(f"[bold red]✗ Skipping detailed analysis - Low Relevance ({relevance_score}/10)[/]")
+                summary = (
+                    f"## ⚠️ Low Relevance Analysis\n\n"
+                    f"This publication has a relevance score of [bold red]{relevance_score}/10[/].\n\n"
+                    f"**Reason for low relevance:** {relevance_text}\n\n"
+                    f"No detailed summary was generated due to low relevance score."
+                )
+        
         return relevance_score, summary
     
+    @staticmethod
+    def _compile_interest_pattern(interests: Iterable[str]) -> Optional["re.Pattern[str]"]:
+        """Compile a case-insensitive pattern matching any word of the interests.
+        
+        Args:
+            interests: Configured interests
+            
+        Returns:
+            Compiled pattern, or None if there are no interest words
+        """
+        words = {word for interest in interests for word in re.findall(r'\w{3,}', interest.lower())}
+        if not words:
+            return None
+        return re.compile(r'\b(?:' + '|'.join(map(re.escape, sorted(words))) + ')', re.IGNORECASE)
+    
+    def iter_analyzed_publications(self, publications: Iterable[Dict[str, Any]]
+                                   ) -> Iterator[Tuple[Dict[str, Any], Tuple[int, str]]]:
+        """Analyze several publications with concurrent requests to Ollama.
+        
+        Publications are consumed lazily, keeping at most twice the configured
+        concurrency in flight, so a streamed input starts work immediately.
+        Publications with the same title and abstract (e.g. one paper listed by
+        several feeds) are analyzed once and share the result, as long as the
+        result is among the DUPLICATE_RESULTS_SIZE most recent ones.
+        
+        Args:
+            publications: Iterable of publication dictionaries
+            
+        Yields:
+            Tuples of (publication, (relevance_score, summary)) in completion order
+        """
+        futures: Dict[Future, Tuple[bytes, List[Dict[str, Any]]]] = {}
+        in_flight: Dict[bytes, Future] = {}
+        # Recent results by digest, bounded so a long streamed run doesn't keep them all
+        results: "OrderedDict[bytes, Tuple[int, str]]" = OrderedDict()
+        
+        def collect(future: Future) -> List[Tuple[Dict[str, Any], Tuple[int, str]]]:
+            key, pubs = futures.pop(future)
+            del in_flight[key]
+            result = results[key] = future.result()
+            if len(results) > DUPLICATE_RESULTS_SIZE:
+                results.popitem(last=False)
+            return [(pub, result) for pub in pubs]
+        
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for pub in publications:
+                key = self._duplicate_key(pub)
+                if key in results:
+                    results.move_to_end(key)
+                    yield pub, results[key]
+                    continue
+                if key in in_flight:
+                    futures[in_flight[key]][1].append(pub)
+                    continue
+                
+                future = executor.submit(self.analyze_publication, pub)
+                futures[future] = (key, [pub])
+                in_flight[key] = future
+                if len(futures) >= 2 * self.concurrency:
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from collect(future)
+            
+            for future in as_completed(list(futures)):
+                yield from collect(future)
+    
+    @staticmethod
+    def _duplicate_key(publication: Dict[str, Any]) -> bytes:
+        """Key identifying publications that would get the same analysis.
+        
+        Args:
+            publication: Publication dictionary
+            
+        Returns:
+            Digest of the normalized title and abstract
+        """
+        title = (publication.get('title') or '').strip().lower()
+        abstract = (publication.get('abstract') or '').strip()
+        return hashlib.blake2b(f"{title}\0{abstract}".encode('utf-8'), digest_size=16).digest()
+    
+    def _chat(self, prompt: str, response_format: str = '', system: str = '') -> str:
+        """Send a prompt to the model, reusing a cached response for identical requests.
+        
+        Args:
+            prompt: Prompt text (user message)
+            response_format: Ollama response format ('json'), empty for free text
+            system: Optional system message sent before the prompt
+            
+        Returns:
+            Response text
+        """
+        key = None
+        if self.cache is not None:
+            key = self.cache.make_key(self.model, prompt, response_format, system)
+            cached = self.cache.get(key) if self.read_cache else None
+            if cached is not None:
+                return cached
+        
+        messages = [{'role': 'system', 'content': system}] if system else []
+        messages.append({
+            'role': 'user',
+            'content': prompt
+        })
+        
+        kwargs = {'format': response_format} if response_format else {}
+        if self.num_predict > 0:
+            kwargs['options'] = {'num_predict': self.num_predict}
+        if self.keep_alive:
+            kwargs['keep_alive'] = self.keep_alive
+        response = self.client.chat(
+            model=self.model,
+            messages=messages,
+            **kwargs
+        )
+        response_text = response['message']['content']
+        
+        if key is not None:
+            self.cache.put(key, response_text)
+        return response_text
+    
+    def _analyze_combined(self, title: str, abstract: str, journal: str = '') -> Optional[Tuple[int, str, str]]:
+        """Rate relevance and summarize a publication in a single JSON-mode request.
+        
+        Args:
+            title: Publication title
+            abstract: Publication abstract
+            journal: Publication journal name
+            
+        Returns:
+            Tuple of (relevance_score, explanation, summary), or None if the
+            request failed or the reply could not be parsed
+        """
+        try:
+            prompt = self._create_combined_prompt(title, abstract, journal)
+            
+            if self.debug:
+                console.print("\n[bold]📤 PROMPT SENT TO LLM:[/]")
+                console.print(Text(f"{self._combined_system}\n\n{prompt}", style="prompt"))
+            
+            response_text = self._chat(prompt, response_format='json', system=self._combined_system)
+            
+            if self.debug:
+                console.print("\n[bold]📥 LLM RESPONSE:[/]")
+                console.print(Text(response_text, style="response"))
+            
+            data = _json_loads(response_text)
+            relevance_score = max(0, min(int(data['score']), 10))
+            explanation = str(data.get('explanation', '')).strip()
+            summary = str(data.get('summary', '')).strip()
+        except Exception as e:
+            console.print(f"[bold yellow]Combined analysis unavailable, using separate requests:[/] {str(e)}")
+            return None
+        
+        score_style = "success" if relevance_score >= 7 else "warning" if relevance_score >= 5 else "error"
+        console.print("\n[bold]🔍 RELEVANCE ANALYSIS:[/]")
+        console.print(f"  [bold]Final Score:[/] [bold {score_style}]{relevance_score}/10[/]")
+        if relevance_score >= 5 and summary:
+            console.print("\n[bold]📝 SUMMARY:[/]")
+            console.print(Panel(
+                summary,
+                title="Summary",
+                border_style="summary",
+                expand=False
+            ))
+        
+        return relevance_score, explanation, summary
+    
     def _determine_relevance(self, title: str, abstract: str) -> Tuple[int, str]:
         """Determine the relevance of a publication to the user's interests.
         
@@ -99,46 +365,23 @@ class OllamaAnalyzer:
             # Define the analysis prompt - this already includes interests from config file
             prompt = self._create_relevance_prompt(title, abstract)
             
-            # Display prompt with Rich formatting
-            console.print("\n[bold]📤 PROMPT SENT TO LLM:[/]")
-            console.print(Syntax(prompt, "text", theme="monokai", word_wrap=True), style="prompt")
+            if self.debug:
+                console.print("\n[bold]📤 PROMPT SENT TO LLM:[/]")
+                console.print(Text(prompt, style="prompt"))
             
             # Call the LLM
-            response = ollama.chat(
-                model=self.model, 
-                messages=[
-                    {
-                        'role': 'user',
-                        'content': prompt
-                    }
-                ]
-            )
-            
-            # Extract the response text
-            response_text = response['message']['content']
-            
-            # Display response with Rich formatting
-            console.print("\n[bold]📥 LLM RESPONSE:[/]")
-            console.print(Syntax(response_text, "text", theme="monokai", word_wrap=True), style="response")
-            
-            # Try multiple patterns to extract relevance score (models format scores differently)
-            # First try the standard N/10 format
-            relevance_match = re.search(r'\b([0-9]|10)\s*\/\s*10\b', response_text)
+            response_text = self._chat(prompt)
             
-            # If that fails, try other common formats
-            if not relevance_match:
-                # Try formats like "Relevance: 7" or "Score: 7" or "Rating: 7"
-                relevance_match = re.search(r'(?:relevance|score|rating)\s*(?:is|:)\s*([0-9]|10)\b', 
-                                          response_text, re.IGNORECASE)
+            if self.debug:
+                console.print("\n[bold]📥 LLM RESPONSE:[/]")
+                console.print(Text(response_text, style="response"))
             
-            # Try a simple number after the word "score" or similar
-            if not relevance_match:
-                relevance_match = re.search(r'(?:score|rating|relevance).*?([0-9]|10)\b', 
-                                          response_text, re.IGNORECASE)
-                
-            # Last resort - just find any number between 0-10 
-            if not relevance_match:
-                relevance_match = re.search(r'\b([0-9]|10)\b', response_text)
+            # Try multiple patterns to extract relevance score
+            relevance_match = None
+            for pattern in _RELEVANCE_PATTERNS:
+                relevance_match = pattern.search(response_text)
+                if relevance_match:
+                    break
             
             # Display relevance match details with Rich formatting
             console.print("\n[bold]🔍 RELEVANCE ANALYSIS:[/]")
@@ -147,8 +390,9 @@ class OllamaAnalyzer:
                 score_style = "success" if score >= 7 else "warning" if score >= 5 else "error"
                 
                 console.print(f"  [bold]Score:[/] [bold {score_style}]{score}/10[/]")
-                console.print(f"  [bold]Match:[/] '{relevance_match.group(0)}'")
-                console.print(f"  [bold]Position:[/] characters {relevance_match.span()[0]}-{relevance_match.span()[1]}")
+                if self.debug:
+                    console.print(f"  [bold]Match:[/] '{relevance_match.group(0)}'")
+                    console.print(f"  [bold]Position:[/] characters {relevance_match.span()[0]}-{relevance_match.span()[1]}")
             else:
                 console.print("  [bold red]NO RELEVANCE MATCH FOUND - defaulting to 0/10[/]")
             
@@ -156,8 +400,7 @@ class OllamaAnalyzer:
             relevance_score = int(relevance_match.group(1)) if relevance_match else 0
             
             # Extract the explanation
-            explanation_match = re.search(r'(?:explanation|because|as)[:.]?\s*(.+)', 
-                                        response_text, re.IGNORECASE | re.DOTALL)
+            explanation_match = _EXPLANATION_RE.search(response_text)
             explanation = explanation_match.group(1).strip() if explanation_match else ""
             
             score_style = "success" if relevance_score >= 7 else "warning" if relevance_score >= 5 else "error"
@@ -186,27 +429,15 @@ class OllamaAnalyzer:
             Formatted summary text with markdown formatting
         """
         try:
-            # Create a prompt that enforces very concise output (1-2 sentences)
-            prompt = f"{self.summary_prompt}\n\n"
-            prompt += f"Journal: {journal}\n"
-            prompt += f"Title: {title}\n"
-            prompt += f"Abstract: {abstract}\n\n"
-            prompt += f"This publication has been rated {relevance_score}/10 for relevance.\n\n"
-            prompt += f"IMPORTANT: Be EXTREMELY concise. Limit your entire response to 1-2 sentences total.\n"
-            prompt += f"Just provide a single concise statement about what the paper does.\n"
-            
-            response = ollama.chat(
-                model=self.model, 
-                messages=[
-                    {
-                        'role': 'user',
-                        'content': prompt
-                    }
-                ]
+            prompt = (
+                f"Journal: {journal}\n"
+                f"Title: {title}\n"
+                f"Abstract: {abstract}\n\n"
+                f"This publication has been rated {relevance_score}/10 for relevance."
             )
             
             # Get the raw summary without truncation
-            summary_text = response['message']['content'].strip()
+            summary_text = self._chat(prompt, system=self._summary_system).strip()
 
             console.print("\n[bold]📝 SUMMARY:[/]")
             console.print(Panel(
@@ -231,12 +462,44 @@ class OllamaAnalyzer:
         Returns:
             Formatted prompt
         """
-        base_prompt = self.relevance_prompt or (
-            "Analyze this scientific publication and determine if it's relevant. "
-            "Rate relevance from 0-10 and explain why."
+        return f"{self.relevance_prompt}\n\nTitle: {title}\n\nAbstract: {abstract}\n\n"
+    
+    def _create_summary_system_prompt(self) -> str:
+        """Create the system message for summary generation.
+        
+        Returns:
+            System prompt enforcing very concise output (1-2 sentences)
+        """
+        return (
+            f"{self.summary_prompt}\n"
+            "Be extremely concise: reply with a single statement of 1-2 sentences about what the paper does."
         )
+    
+    def _create_combined_system_prompt(self) -> str:
+        """Create the system message asking for relevance and summary as one JSON object.
         
-        return f"{base_prompt}\n\nTitle: {title}\n\nAbstract: {abstract}\n\n"
+        Returns:
+            System prompt
+        """
+        return (
+            f"{self.relevance_prompt}\n"
+            f"Also: {self.summary_prompt} Limit the summary to 1-2 sentences.\n"
+            'Respond ONLY with a JSON object with the keys "score" (integer 0-10), '
+            '"explanation" (1-2 sentences) and "summary" (1-2 sentences).'
+        )
+    
+    def _create_combined_prompt(self, title: str, abstract: str, journal: str = '') -> str:
+        """Create the user message for a combined relevance and summary request.
+        
+        Args:
+            title: Publication title
+            abstract: Publication abstract
+            journal: Publication journal name
+            
+        Returns:
+            Formatted prompt
+        """
+        return f"Journal: {journal}\nTitle: {title}\nAbstract: {abstract}"
     
     def _create_summary_prompt(self, title: str, abstract: str) -> str:
         """Create a prompt for summary generation.
@@ -248,11 +511,7 @@ class OllamaAnalyzer:
         Returns:
             Formatted prompt
         """
-        base_prompt = self.summary_prompt or (
-            "Create a concise summary of this scientific publication highlighting key findings and methodology."
-        )
-        
-        return f"{base_prompt}\n\nTitle: {title}\n\nAbstract: {abstract}\n\n"
+        return f"{self.summary_prompt}\n\nTitle: {title}\n\nAbstract: {abstract}\n\n"
     
     def _extract_relevance_score(self, text: str) -> int:
         """Extract relevance score from LLM response.
@@ -264,15 +523,8 @@ class OllamaAnalyzer:
             Relevance score (0-10)
         """
         # Look for patterns like "Relevance: 7/10" or "Score: 7" or just "7/10"
-        patterns = [
-            r'relevance:?\s*(\d+)(?:/10)?',
-            r'score:?\s*(\d+)(?:/10)?',
-            r'rating:?\s*(\d+)(?:/10)?',
-            r'(\d+)/10',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _SCORE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 try:
                     score = int(match.group(1))
@@ -282,17 +534,7 @@ class OllamaAnalyzer:
                     pass
         
         # If no score found, estimate based on positive/negative language
-        positive_terms = ['relevant', 'interesting', 'important', 'significant', 'novel']
-        negative_terms = ['irrelevant', 'not relevant', 'unrelated', 'not aligned']
-        
-        score = 5  # Default neutral score
-        
-        for term in positive_terms:
-            if term in text.lower():
-                score += 1
-        
-        for term in negative_terms:
-            if term in text.lower():
-                score -= 1
+        found = {match.group(1) for match in _SENTIMENT_TERMS_RE.finditer(text.lower())}
+        score = 5 + len(found & _POSITIVE_TERMS) - len(found & _NEGATIVE_TERMS)  # 5 is neutral
         
         return max(0, min(score, 10))  # Ensure score is between 0 and 10
@@ -0,0 +1,59 @@
+"""On-disk cache of LLM responses keyed by model and prompt."""
+
+import hashlib
+from typing import Optional
+
+from ..db.kvstore import KeyValueStore
+
+
+class ResponseCache:
+    """SQLite cache of Ollama responses, keyed by a hash of the request."""
+
+    def __init__(self, cache_path: str):
+        """Initialize the response cache.
+
+        Args:
+            cache_path: Path to the SQLite cache file
+        """
+        self.store = KeyValueStore(cache_path)
+        self.cache_path = self.store.path
+
+    @staticmethod
+    def make_key(model: str, prompt: str, response_format: str = '', system: str = '') -> bytes:
+        """Build the cache key for a request.
+
+        Args:
+            model: Model name
+            prompt: Prompt text
+            response_format: Requested response format ('' for free text)
+            system: System message ('' if none)
+
+        Returns:
+            SHA-256 digest identifying the request
+        """
+        request = f"{model}\0{response_format}\0{system}\0{prompt}"
+        return hashlib.sha256(request.encode('utf-8')).digest()
+
+    def get(self, key: bytes) -> Optional[str]:
+        """Get a cached response.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Response text, or None if not cached
+        """
+        return self.store.get(key)
+
+    def put(self, key: bytes, response: str) -> None:
+        """Store a response.
+
+        Args:
+            key: Cache key from make_key
+            response: Response text
+        """
+        self.store.put(key, response)
+
+    def close(self) -> None:
+        """Close the cache database."""
+        self.store.close()
@@ -2,15 +2,29 @@
 
 import os
 import json
+from collections import OrderedDict
 from datetime import datetime, date
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import TYPE_CHECKING, Dict, List, Any, Optional
 
-from rich.console import Console
-from rich.table import Table
-from rich.text import Text
-from rich.panel import Panel
-from rich.markdown import Markdown
+if TYPE_CHECKING:
+    from rich.console import Console
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+# Maximum number of parsed reports kept in memory
+REPORT_CACHE_SIZE = 32
+
+
+def _today_iso() -> str:
+    """Get today's date as an ISO string (YYYY-MM-DD), the default report date."""
+    return date.today().isoformat()
 
 
 class ReportGenerator:
@@ -25,8 +39,15 @@ class ReportGenerator:
         """
         self.reports_path = os.path.expanduser(reports_path)
         os.makedirs(self.reports_path, exist_ok=True)
-        self.console = Console()
         self.min_relevance = min_relevance
+        # Parsed reports keyed by file path, with the file's mtime when parsed
+        self._report_cache: OrderedDict = OrderedDict()
+    
+    @cached_property
+    def console(self) -> "Console":
+        """Console for terminal output, created on first display."""
+        from rich.console import Console
+        return Console()
     
     def generate_daily_report(self, publications: List[Dict[str, Any]], date_str: str) -> Dict[str, Any]:
         """Generate a daily report for a list of publications.
@@ -38,8 +59,20 @@ class ReportGenerator:
         Returns:
             Report dictionary
         """
-        # Filter out publications with low relevance scores
-        relevant_publications = [p for p in publications if p.get('relevance_score', 0) >= self.min_relevance]
+        # Filter out publications with low relevance scores, counting relevance
+        # bands in the same pass
+        relevant_publications = []
+        high_relevance = 0
+        medium_relevance = 0
+        for pub in publications:
+            score = pub.get('relevance_score', 0)
+            if score < self.min_relevance:
+                continue
+            relevant_publications.append(pub)
+            if score >= 8:
+                high_relevance += 1
+            elif score >= 7:
+                medium_relevance += 1
         
         # Sort publications by relevance score (highest first)
         relevant_publications.sort(key=lambda p: p.get('relevance_score', 0), reverse=True)
@@ -48,16 +81,13 @@ class ReportGenerator:
         if relevant_publications:
             summary = f"Found {len(relevant_publications)} publications with relevance score >= {self.min_relevance} for {date_str}."
             
-            # Add publication count by relevance band
-            high_relevance = len([p for p in relevant_publications if p.get('relevance_score', 0) >= 8])
-            medium_relevance = len([p for p in relevant_publications if 7 <= p.get('relevance_score', 0) < 8])
-            
             if high_relevance > 0:
                 summary += f"\n\n{high_relevance} publications have high relevance (8-10)."
             if medium_relevance > 0:
                 summary += f"\n{medium_relevance} publications have medium relevance (7)."
             
-            # Add top fields/journals if available
+            # Add top fields/journals if available (counted in relevance order
+            # so that ties between journals keep their order)
             journals = {}
             for pub in relevant_publications:
                 journal = pub.get('journal', 'Unknown')
@@ -97,11 +127,20 @@ class ReportGenerator:
             "date": report_date,
             "generated_at": datetime.now().isoformat(),
             "summary": summary,
+            "min_relevance": self.min_relevance,
             "publications": publications
         }
         
-        with open(report_file, 'w') as f:
-            json.dump(report_data, f, indent=2)
+        # Serialize in one go and write once; json.dump issues a write per token
+        if orjson is not None:
+            data = orjson.dumps(report_data, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(report_data, indent=2).encode('utf-8')
+        
+        with open(report_file, 'wb') as f:
+            f.write(data)
+        
+        self._report_cache.pop(report_file, None)
     
     def get_report(self, report_date: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Get a previously generated report.
@@ -110,18 +149,34 @@ class ReportGenerator:
             report_date: Date string in ISO format (YYYY-MM-DD)
             
         Returns:
-            Report data dictionary or None if not found
+            Report data dictionary or None if not found. The dictionary is
+            cached and shared between calls, so callers must not modify it.
         """
         if not report_date:
-            report_date = datetime.now().strftime('%Y-%m-%d')
+            report_date = _today_iso()
         
         report_file = os.path.join(self.reports_path, f"report_{report_date}.json")
         
-        if not os.path.exists(report_file):
+        try:
+            mtime = os.stat(report_file).st_mtime_ns
+        except FileNotFoundError:
+            self._report_cache.pop(report_file, None)
             return None
         
-        with open(report_file, 'r') as f:
-            return json.load(f)
+        cached = self._report_cache.get(report_file)
+        if cached and cached[0] == mtime:
+            self._report_cache.move_to_end(report_file)
+            return cached[1]
+        
+        with open(report_file, 'rb') as f:
+            report = _json_loads(f.read())
+        
+        self._report_cache[report_file] = (mtime, report)
+        self._report_cache.move_to_end(report_file)
+        if len(self._report_cache) > REPORT_CACHE_SIZE:
+            self._report_cache.popitem(last=False)
+        
+        return report
     
     def display_report(self, report_date: Optional[str] = None) -> None:
         """Display a report in the terminal.
@@ -129,8 +184,12 @@ class ReportGenerator:
         Args:
             report_date: Date string in ISO format (YYYY-MM-DD)
         """
+        from rich.markdown import Markdown
+        from rich.panel import Panel
+        from rich.table import Table
+        
         if not report_date:
-            report_date = datetime.now().strftime('%Y-%m-%d')
+            report_date = _today_iso()
         
         report = self.get_report(report_date)
         
@@ -152,30 +211,29 @@ class ReportGenerator:
         table.add_column("Title", style="green")
         table.add_column("Relevance", justify="center", style="magenta", width=10)
         
-        # Count relevant publications for display
-        relevant_count = 0
-        relevant_pubs = []
-        
-        for pub in report.get('publications', []):
-            relevance = pub.get('relevance_score', 0)
-            if relevance >= self.min_relevance:  # Only show publications above threshold
-                relevant_count += 1
-                relevant_pubs.append(pub)
-                table.add_row(
-                    str(pub.get('id', '')),
-                    pub.get('journal', ''),
-                    pub.get('title', ''),
-                    f"{relevance}/10"
-                )
-        
-        if relevant_count > 0:
+        # Reports store only publications at or above the threshold they were
+        # generated with, so filtering is only needed if the threshold is now higher
+        # (or unknown, for reports written before it was stored)
+        relevant_pubs = report.get('publications', [])
+        if report.get('min_relevance', 0) < self.min_relevance:
+            relevant_pubs = [pub for pub in relevant_pubs if pub.get('relevance_score', 0) >= self.min_relevance]
+        
+        for pub in relevant_pubs:
+            table.add_row(
+                str(pub.get('id', '')),
+                pub.get('journal', ''),
+                pub.get('title', ''),
+                f"{pub.get('relevance_score', 0)}/10"
+            )
+        
+        if relevant_pubs:
             self.console.print(table)
             
             # Create a consolidated summary of all relevant publications
             self.console.print("\n[bold]Publication Summaries:[/bold]")
             
             # Create a consolidated markdown content with better formatting
-            consolidated_summary = "## Relevant Publications Summary\n\n"
+            parts = ["## Relevant Publications Summary\n\n"]
             
             # Sort publications by relevance score (highest first)
             sorted_pubs = sorted(relevant_pubs, key=lambda x: x.get('relevance_score', 0), reverse=True)
@@ -189,14 +247,16 @@ class ReportGenerator:
                 journal = pub.get('journal', '')
                 
                 # Add each publication's info to the consolidated summary with better formatting
-                consolidated_summary += f"### {title}\n\n"
-                consolidated_summary += f"**ID:** {pub_id} | **Journal:** {journal} | **Relevance:** {relevance}/10\n"
+                parts.append(f"### {title}\n\n")
+                parts.append(f"**ID:** {pub_id} | **Journal:** {journal} | **Relevance:** {relevance}/10\n")
                 if url:
-                    consolidated_summary += f"**URL:** [{url}]({url})\n\n"
+                    parts.append(f"**URL:** [{url}]({url})\n\n")
                 else:
-                    consolidated_summary += "\n\n"
-                consolidated_summary += f"{summary}\n\n"
-                consolidated_summary += "---\n\n"  # Add a separator between publications
+                    parts.append("\n\n")
+                parts.append(f"{summary}\n\n")
+                parts.append("---\n\n")  # Add a separator between publications
+            
+            consolidated_summary = "".join(parts)
                 
             # Display the consolidated summary in a single panel
             self.console.print(Panel(
@@ -217,13 +277,15 @@ class ReportGenerator:
         Returns:
             List of report dates
         """
-        reports = []
-        for file in os.listdir(self.reports_path):
-            if file.startswith("report_") and file.endswith(".json"):
-                date_str = file[7:-5]  # Extract date from filename
-                reports.append(date_str)
-        
-        return sorted(reports, reverse=True)
+        with os.scandir(self.reports_path) as entries:
+            reports = [
+                entry.name[7:-5]  # Extract date from filename
+                for entry in entries
+                if entry.name.startswith("report_") and entry.name.endswith(".json")
+            ]
+        
+        reports.sort(reverse=True)
+        return reports
     
     def display_publication_details(self, publication: Dict[str, Any]) -> None:
         """Display detailed information about a publication.
@@ -231,6 +293,8 @@ class ReportGenerator:
         Args:
             publication: Publication dictionary
         """
+        from rich.panel import Panel
+        
         title = publication.get('title', 'Untitled')
         journal = publication.get('journal', '')
         pub_date = publication.get('pub_date', '')
@@ -0,0 +1,46 @@
+"""Text helpers shared by the LitLum subsystems."""
+
+import html
+import re
+
+# Leading "Abstract" heading that CrossRef abstracts usually start with
+_ABSTRACT_LABEL_RE = re.compile(r'^\s*<(?:jats:)?title>[^<]*</(?:jats:)?title>')
+
+# Block-level tags, replaced by a space so words on either side stay apart
+_BLOCK_TAGS = frozenset({'p', 'sec', 'title', 'list', 'list-item', 'br', 'div', 'li', 'ul', 'ol'})
+# Unprefixed HTML tags that occasionally appear in abstracts
+_HTML_TAGS = _BLOCK_TAGS - {'sec', 'title', 'list', 'list-item'} | {
+    'i', 'b', 'em', 'strong', 'sub', 'sup', 'span', 'a', 'u'
+}
+
+# A JATS/MathML tag, or one of the known HTML tags, with only name="value"
+# attributes, so comparisons like "x<y and z>w" are left alone
+_MARKUP_TAG_RE = re.compile(
+    r'<(/?)((?:jats|mml):[a-zA-Z][\w.-]*|'
+    + '|'.join(sorted(_HTML_TAGS, key=len, reverse=True))
+    + r')(?:\s+[\w:.-]+\s*=\s*(?:"[^"]*"|\'[^\']*\'))*\s*/?>',
+    re.IGNORECASE
+)
+
+
+def _replace_tag(match: "re.Match[str]") -> str:
+    """Replace block-level tags with a space and drop inline ones."""
+    name = match.group(2).rpartition(':')[2].lower()
+    return ' ' if name in _BLOCK_TAGS else ''
+
+
+def clean_abstract(abstract: str) -> str:
+    """Strip markup from a CrossRef abstract and collapse whitespace.
+
+    A leading "Abstract" title element is dropped, tags are removed in a
+    single regex pass, entities are unescaped and whitespace is normalized.
+
+    Args:
+        abstract: Abstract as returned by the CrossRef API
+
+    Returns:
+        Plain-text abstract
+    """
+    if '<' in abstract:
+        abstract = _MARKUP_TAG_RE.sub(_replace_tag, _ABSTRACT_LABEL_RE.sub('', abstract))
+    return html.unescape(' '.join(abstract.split()))
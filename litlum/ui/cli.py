@@ -2,40 +2,141 @@
 
 import sys
 import os
+import time
 import argparse
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, List, Optional
 
 from rich.console import Console
-from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.prompt import Prompt, Confirm
 from rich.table import Table
 
 from litlum.config import Config
-from litlum.db.database import Database
-from litlum.feeds.parser import FeedParser
-from litlum.llm.analyzer import OllamaAnalyzer
-from litlum.reports.generator import ReportGenerator
-from litlum.web.static_site_generator import StaticSiteGenerator
+
+if TYPE_CHECKING:
+    from litlum.db.database import Database
+    from litlum.feeds.parser import FeedParser
+    from litlum.llm.analyzer import OllamaAnalyzer
+    from litlum.reports.generator import ReportGenerator
+    from litlum.web.static_site_generator import StaticSiteGenerator
+
+# Number of analysis results written to the database per transaction
+ANALYSIS_BATCH_SIZE = 32
+
+# Minimum number of seconds between progress description and ETA refreshes
+PROGRESS_UPDATE_INTERVAL = 0.25
+
+
+@lru_cache(maxsize=1)
+def _create_argument_parser() -> argparse.ArgumentParser:
+    """Create the argument parser for CLI commands.
+    
+    The parser is built once per process and reused across CLI.run calls.
+    
+    Returns:
+        Configured argument parser
+    """
+    parser = argparse.ArgumentParser(
+        description='LitLum - Monitor and analyze scientific publications'
+    )
+    
+    subparsers = parser.add_subparsers(dest='command', help='Command')
+    
+    # Fetch command
+    fetch_parser = subparsers.add_parser('fetch', help='Fetch publications from RSS feeds')
+    
+    # Analyze command
+    analyze_parser = subparsers.add_parser('analyze', help='Analyze unprocessed publications')
+    analyze_parser.add_argument('--reanalyze', action='store_true', help='Reanalyze already processed publications')
+    analyze_parser.add_argument('--date', help='Analyze publications from a specific date (YYYY-MM-DD)')
+    
+    # Report command
+    report_parser = subparsers.add_parser('report', help='Generate or display reports')
+    report_parser.add_argument('--date', help='Report date (YYYY-MM-DD, defaults to today)')
+    report_parser.add_argument('--generate', action='store_true', help='Generate a new report')
+    
+    # List command
+    list_parser = subparsers.add_parser('list', help='List reports or publications')
+    list_parser.add_argument('--reports', action='store_true', help='List available reports')
+    list_parser.add_argument('--publications', action='store_true', help='List recent publications')
+    list_parser.add_argument('--days', type=int, default=7, help='Number of days to look back (default: 7)')
+    list_parser.add_argument('--min-relevance', type=int, default=0, help='Minimum relevance score (0-10)')
+    
+    # Show command
+    show_parser = subparsers.add_parser('show', help='Show publication details')
+    show_parser.add_argument('id', type=int, help='Publication ID')
+    
+    # Run command - performs fetch, analyze, report in sequence
+    run_parser = subparsers.add_parser('run', help='Run the full workflow: fetch, analyze, and report')
+    run_parser.add_argument('--serve', action='store_true', help='Start a local web server after generating the site')
+    run_parser.add_argument('--reanalyze', action='store_true', help='Reanalyze already processed publications')
+    
+    # Reset command
+    reset_parser = subparsers.add_parser('reset', help='Reset the LitLum application')
+    reset_parser.add_argument('--force', action='store_true', help='Force reset without confirmation')
+    reset_parser.add_argument('--keep-config', action='store_true', help='Keep configuration files')
+    
+    # Web command
+    web_parser = subparsers.add_parser('web', help='Generate static website from reports')
+    web_parser.add_argument('--serve', action='store_true', help='Start a local web server to preview the site')
+    
+    return parser
 
 
 class CLI:
     """Command line interface for the LitLum application."""
     
     def __init__(self):
-        """Initialize the CLI interface."""
-        self.console = Console()
-        self.config = Config()
-        self.db = Database(self.config.get_database_path())
-        self.feed_parser = FeedParser()
-        self.ollama_analyzer = OllamaAnalyzer(self.config.get_ollama_config())
-        self.report_generator = ReportGenerator(
+        """Initialize the CLI interface.
+        
+        Subsystems are created (and their modules imported) on first use, so
+        commands only pay for the parts they need.
+        """
+        # Skip highlighting and live progress when output is piped (e.g. from cron)
+        self.console = Console(highlight=sys.stdout.isatty(), emoji=False)
+        self.config = Config.instance()
+    
+    @cached_property
+    def db(self) -> "Database":
+        """Database connection."""
+        from litlum.db.database import Database
+        return Database(self.config.get_database_path())
+    
+    @cached_property
+    def feed_parser(self) -> "FeedParser":
+        """CrossRef feed parser with a response cache."""
+        from litlum.feeds.cache import FeedCache
+        from litlum.feeds.parser import FeedParser
+        return FeedParser(
+            self.config,
+            cache=FeedCache(self.config.get_feed_cache_path())
+        )
+    
+    @cached_property
+    def ollama_analyzer(self) -> "OllamaAnalyzer":
+        """Ollama publication analyzer with a response cache."""
+        from litlum.llm.analyzer import OllamaAnalyzer
+        from litlum.llm.cache import ResponseCache
+        return OllamaAnalyzer(
+            self.config.get_ollama_config(),
+            cache=ResponseCache(self.config.get_llm_cache_path())
+        )
+    
+    @cached_property
+    def report_generator(self) -> "ReportGenerator":
+        """Report generator."""
+        from litlum.reports.generator import ReportGenerator
+        return ReportGenerator(
             reports_path=self.config.get_reports_path(),
             min_relevance=self.config.get_min_relevance()
         )
-        # Initialize the static site generator
-        self.site_generator = StaticSiteGenerator(
+    
+    @cached_property
+    def site_generator(self) -> "StaticSiteGenerator":
+        """Static site generator."""
+        from litlum.web.static_site_generator import StaticSiteGenerator
+        return StaticSiteGenerator(
             reports_path=self.config.get_reports_path(),
             output_path=self.config.get_web_path()
         )
@@ -46,7 +147,7 @@ class CLI:
         Args:
             args: Command line arguments
         """
-        parser = self._create_argument_parser()
+        parser = _create_argument_parser()
         parsed_args = parser.parse_args(args)
         
         # Process command
@@ -72,58 +173,6 @@ class CLI:
             # Default to showing help
             parser.print_help()
     
-    def _create_argument_parser(self) -> argparse.ArgumentParser:
-        """Create the argument parser for CLI commands.
-        
-        Returns:
-            Configured argument parser
-        """
-        parser = argparse.ArgumentParser(
-            description='LitLum - Monitor and analyze scientific publications'
-        )
-        
-        subparsers = parser.add_subparsers(dest='command', help='Command')
-        
-        # Fetch command
-        fetch_parser = subparsers.add_parser('fetch', help='Fetch publications from RSS feeds')
-        
-        # Analyze command
-        analyze_parser = subparsers.add_parser('analyze', help='Analyze unprocessed publications')
-        analyze_parser.add_argument('--reanalyze', action='store_true', help='Reanalyze already processed publications')
-        analyze_parser.add_argument('--date', help='Analyze publications from a specific date (YYYY-MM-DD)')
-        
-        # Report command
-        report_parser = subparsers.add_parser('report', help='Generate or display reports')
-        report_parser.add_argument('--date', help='Report date (YYYY-MM-DD, defaults to today)')
-        report_parser.add_argument('--generate', action='store_true', help='Generate a new report')
-        
-        # List command
-        list_parser = subparsers.add_parser('list', help='List reports or publications')
-        list_parser.add_argument('--reports', action='store_true', help='List available reports')
-        list_parser.add_argument('--publications', action='store_true', help='List recent publications')
-        list_parser.add_argument('--days', type=int, default=7, help='Number of days to look back (default: 7)')
-        list_parser.add_argument('--min-relevance', type=int, default=0, help='Minimum relevance score (0-10)')
-        
-        # Show command
-        show_parser = subparsers.add_parser('show', help='Show publication details')
-        show_parser.add_argument('id', type=int, help='Publication ID')
-        
-        # Run command - performs fetch, analyze, report in sequence
-        run_parser = subparsers.add_parser('run', help='Run the full workflow: fetch, analyze, and report')
-        run_parser.add_argument('--serve', action='store_true', help='Start a local web server after generating the site')
-        run_parser.add_argument('--reanalyze', action='store_true', help='Reanalyze already processed publications')
-        
-        # Reset command
-        reset_parser = subparsers.add_parser('reset', help='Reset the LitLum application')
-        reset_parser.add_argument('--force', action='store_true', help='Force reset without confirmation')
-        reset_parser.add_argument('--keep-config', action='store_true', help='Keep configuration files')
-        
-        # Web command
-        web_parser = subparsers.add_parser('web', help='Generate static website from reports')
-        web_parser.add_argument('--serve', action='store_true', help='Start a local web server to preview the site')
-        
-        return parser
-    
     def _handle_fetch(self, args: argparse.Namespace) -> None:
         """Handle the fetch command.
         
@@ -138,13 +187,14 @@ class CLI:
         
         self.console.print(f"[bold]Fetching publications from all feeds[/bold]")
         
-        import time
-        from datetime import timedelta
+        # Publications we already have are skipped by the parser
+        self.feed_parser.known_guids = self.db.get_publication_guids()
         
         total_new = 0
         
         # Track time for estimation
-        start_time = time.time()
+        start_time = time.monotonic()
+        last_update = 0.0
         processed_count = 0
         total_count = len(feeds)
         
@@ -154,7 +204,8 @@ class CLI:
             TextColumn("[cyan]({task.completed}/{task.total})"),
             TextColumn("[yellow]Remaining: {task.remaining}"),
             TextColumn("[green]Est: {task.fields[est_time]}"),
-            console=self.console
+            console=self.console,
+            disable=not self.console.is_terminal
         ) as progress:
             task = progress.add_task(
                 f"Fetching publications from {total_count} feeds...", 
@@ -162,44 +213,43 @@ class CLI:
                 est_time="calculating..."
             )
             
-            for feed_config in feeds:
-                feed_name = feed_config.get('name', 'Unknown')
-                progress.update(task, description=f"Fetching from {feed_name}...")
-                
-                # Measure time for this feed
-                feed_start_time = time.time()
+            # Feeds are fetched concurrently and handled here as each one completes
+            for feed_config, publications in self.feed_parser.iter_parsed_feeds(feeds):
+                # Add to database in a single transaction per feed
+                total_new += self.db.add_publications(publications)
                 
-                # Parse feed
-                publications = self.feed_parser.parse_feed(feed_config)
-                
-                # Add to database
-                new_count = 0
-                for pub in publications:
-                    if self.db.add_publication(pub):
-                        new_count += 1
-                
-                total_new += new_count
-                
-                # Update time metrics
-                feed_elapsed = time.time() - feed_start_time
                 processed_count += 1
-                
-                # Calculate average time per feed and estimate remaining time
-                if processed_count > 0:
-                    avg_time_per_feed = (time.time() - start_time) / processed_count
-                    remaining_feeds = total_count - processed_count
-                    est_remaining_seconds = avg_time_per_feed * remaining_feeds
-                    
-                    # Format as hours:minutes:seconds
-                    est_remaining = str(timedelta(seconds=int(est_remaining_seconds)))
-                    
-                    # Update progress with estimated time
-                    progress.update(task, est_time=est_remaining)
-                
                 progress.advance(task)
+                
+                # Refresh the description and estimate at most every PROGRESS_UPDATE_INTERVAL
+                now = time.monotonic()
+                if now - last_update >= PROGRESS_UPDATE_INTERVAL or processed_count == total_count:
+                    last_update = now
+                    feed_name = feed_config.get('name', 'Unknown')
+                    progress.update(
+                        task,
+                        description=f"Fetched {feed_name}...",
+                        est_time=self._format_eta(now - start_time, processed_count, total_count)
+                    )
         
         self.console.print(f"[bold green]Fetch complete. {total_new} new publications added.[/bold green]")
     
+    @staticmethod
+    def _format_eta(elapsed: float, processed_count: int, total_count: int) -> str:
+        """Estimate the remaining time from the average time per processed item.
+        
+        Args:
+            elapsed: Seconds elapsed since processing started
+            processed_count: Number of items processed so far
+            total_count: Total number of items
+            
+        Returns:
+            Remaining time formatted as hours:minutes:seconds
+        """
+        avg_time_per_item = elapsed / processed_count
+        est_remaining_seconds = avg_time_per_item * (total_count - processed_count)
+        return str(timedelta(seconds=int(est_remaining_seconds)))
+    
     def _handle_analyze(self, args: argparse.Namespace) -> None:
         """Handle the analyze command.
         
@@ -215,39 +265,42 @@ class CLI:
                 if args.reanalyze:
                     # Get all publications from date for reanalysis
                     publications = self.db.get_publications_by_date(date_str)
-                    self.console.print(f"[bold]Reanalyzing {len(publications)} publications from {date_str}...[/bold]")
+                    total_count = len(publications)
+                    self.console.print(f"[bold]Reanalyzing {total_count} publications from {date_str}...[/bold]")
                 else:
-                    # Filter to only unprocessed publications
-                    publications = self.db.get_publications_by_date(date_str)
-                    publications = [p for p in publications if p.get('relevance_score') is None]
-                    self.console.print(f"[bold]Analyzing {len(publications)} unprocessed publications from {date_str}...[/bold]")
+                    # Only get unprocessed publications from date
+                    publications = self.db.get_unprocessed_publications_by_date(date_str)
+                    total_count = len(publications)
+                    self.console.print(f"[bold]Analyzing {total_count} unprocessed publications from {date_str}...[/bold]")
             except ValueError:
                 self.console.print("[bold red]Invalid date format. Use YYYY-MM-DD.[/bold red]")
                 return
         else:
             if args.reanalyze:
-                # Get all publications for reanalysis
-                cursor = self.db.conn.cursor()
-                cursor.execute('SELECT id, journal, title, abstract, url, pub_date, guid FROM publications')
-                publications = [dict(row) for row in cursor.fetchall()]
-                self.console.print(f"[bold]Reanalyzing {len(publications)} publications...[/bold]")
+                # Stream all publications for reanalysis instead of loading them up front
+                total_count = self.db.count_publications()
+                publications = self.db.iter_publications()
+                self.console.print(f"[bold]Reanalyzing {total_count} publications...[/bold]")
             else:
                 # Only get unprocessed publications
                 publications = self.db.get_unprocessed_publications()
-                self.console.print(f"[bold]Analyzing {len(publications)} unprocessed publications...[/bold]")
+                total_count = len(publications)
+                self.console.print(f"[bold]Analyzing {total_count} unprocessed publications...[/bold]")
         
-        if not publications:
+        if not total_count:
             self.console.print("[bold yellow]No publications to analyze.[/bold yellow]")
             return
         
-        # Analyze publications
-        import time
-        from datetime import timedelta
+        # Reanalysis asks the model again instead of returning cached replies
+        self.ollama_analyzer.read_cache = not args.reanalyze
+        
+        # Load the model up front rather than on the first publication
+        self.ollama_analyzer.warm_up()
         
         # Track time for estimation
-        start_time = time.time()
+        start_time = time.monotonic()
+        last_update = 0.0
         processed_count = 0
-        total_count = len(publications)
         
         with Progress(
             SpinnerColumn(),
@@ -255,7 +308,8 @@ class CLI:
             TextColumn("[cyan]({task.completed}/{task.total})"),
             TextColumn("[yellow]Remaining: {task.remaining}"),
             TextColumn("[green]Est: {task.fields[est_time]}"),
-            console=self.console
+            console=self.console,
+            disable=not self.console.is_terminal
         ) as progress:
             task = progress.add_task(
                 f"Analyzing publications...", 
@@ -263,39 +317,35 @@ class CLI:
                 est_time="calculating..."
             )
             
-            for i, pub in enumerate(publications):
-                pub_title = pub.get('title', '')[:40]
-                progress.update(
-                    task, 
-                    description=f"Analyzing: {pub_title}..."
-                )
-                
-                # Measure time for this publication
-                pub_start_time = time.time()
-                
-                # Process the publication
-                relevance_score, summary = self.ollama_analyzer.analyze_publication(pub)
-                self.db.update_publication_analysis(pub['id'], relevance_score, summary)
-                
-                # Update time metrics
-                pub_elapsed = time.time() - pub_start_time
-                processed_count += 1
-                
-                # Calculate average time per publication and estimate remaining time
-                if processed_count > 0:
-                    avg_time_per_pub = (time.time() - start_time) / processed_count
-                    remaining_pubs = total_count - processed_count
-                    est_remaining_seconds = avg_time_per_pub * remaining_pubs
+            pending = []
+            try:
+                # Publications are analyzed concurrently and stored here as each one completes
+                for pub, (relevance_score, summary) in self.ollama_analyzer.iter_analyzed_publications(publications):
+                    # Write results in batches rather than one commit per publication
+                    pending.append((pub['id'], relevance_score, summary))
+                    if len(pending) >= ANALYSIS_BATCH_SIZE:
+                        self.db.update_publications_analysis(pending)
+                        pending.clear()
                     
-                    # Format as hours:minutes:seconds
-                    est_remaining = str(timedelta(seconds=int(est_remaining_seconds)))
+                    processed_count += 1
+                    progress.advance(task)
                     
-                    # Update progress with estimated time
-                    progress.update(task, est_time=est_remaining)
-                
-                progress.advance(task)
+                    # Refresh the description and estimate at most every PROGRESS_UPDATE_INTERVAL
+                    now = time.monotonic()
+                    if now - last_update >= PROGRESS_UPDATE_INTERVAL or processed_count == total_count:
+                        last_update = now
+                        pub_title = pub.get('title', '')[:40]
+                        progress.update(
+                            task,
+                            description=f"Analyzed: {pub_title}...",
+                            est_time=self._format_eta(now - start_time, processed_count, total_count)
+                        )
+            finally:
+                # Persist whatever was analyzed, also when interrupted
+                if pending:
+                    self.db.update_publications_analysis(pending)
         
-        self.console.print(f"[bold green]Analysis complete. {len(publications)} publications analyzed.[/bold green]")
+        self.console.print(f"[bold green]Analysis complete. {processed_count} publications analyzed.[/bold green]")
     
     def _handle_report(self, args: argparse.Namespace) -> None:
         """Handle the report command.
@@ -374,12 +424,6 @@ class CLI:
             days = args.days or 7
             min_relevance = args.min_relevance or 0
             
-            publications = self.db.get_recent_publications(days, min_relevance)
-            
-            if not publications:
-                self.console.print(f"[bold yellow]No publications found in the last {days} days with minimum relevance {min_relevance}.[/bold yellow]")
-                return
-            
             table = Table(title=f"Recent Publications (Last {days} days, Min Relevance: {min_relevance})")
             table.add_column("ID", style="dim")
             table.add_column("Date", style="cyan")
@@ -387,15 +431,19 @@ class CLI:
             table.add_column("Title", style="green")
             table.add_column("Relevance", justify="center", style="magenta")
             
-            for pub in publications:
+            for pub in self.db.iter_recent_publications(days, min_relevance):
                 table.add_row(
-                    str(pub.get('id', '')),
-                    pub.get('pub_date', '')[:10] if pub.get('pub_date') else '',
-                    pub.get('journal', ''),
-                    pub.get('title', ''),
-                    f"{pub.get('relevance_score', 0)}/10"
+                    str(pub['id']),
+                    pub['pub_date'][:10] if pub['pub_date'] else '',
+                    pub['journal'],
+                    pub['title'],
+                    f"{pub['relevance_score']}/10"
                 )
             
+            if not table.row_count:
+                self.console.print(f"[bold yellow]No publications found in the last {days} days with minimum relevance {min_relevance}.[/bold yellow]")
+                return
+            
             self.console.print(table)
         
         else:
@@ -410,19 +458,12 @@ class CLI:
         pub_id = args.id
         
         # Get publication from database
-        cursor = self.db.conn.cursor()
-        cursor.execute('''
-        SELECT id, journal, title, abstract, url, pub_date, guid, relevance_score, llm_summary
-        FROM publications
-        WHERE id = ?
-        ''', (pub_id,))
-        row = cursor.fetchone()
-        
-        if not row:
+        publication = self.db.get_publication(pub_id)
+        
+        if not publication:
             self.console.print(f"[bold red]Publication with ID {pub_id} not found.[/bold red]")
             return
         
-        publication = dict(row)
         self.report_generator.display_publication_details(publication)
     
     def _handle_reset(self, args: argparse.Namespace) -> None:
@@ -432,7 +473,16 @@ class CLI:
             args: Parsed arguments
         """
         if not args.force:
-            confirm = Confirm.ask("\n[bold red]WARNING: This will delete all publications and reports. Continue?[/bold red]")
+            # Without a terminal there is nobody to answer the prompt (e.g. under cron)
+            if not sys.stdin.isatty():
+                self.console.print("[bold red]Not running interactively, use --force to reset.[/bold red]")
+                return
+            
+            from rich.prompt import Confirm
+            confirm = Confirm.ask(
+                "\n[bold red]WARNING: This will delete all publications and reports. Continue?[/bold red]",
+                console=self.console
+            )
             if not confirm:
                 self.console.print("Reset cancelled.")
                 return
@@ -448,16 +498,26 @@ class CLI:
             os.remove(db_path)
             self.console.print(f"[bold green]Database deleted: {db_path}[/bold green]")
         
+        # Delete cached LLM responses along with the analyses they produced
+        llm_cache_path = str(self.config.get_llm_cache_path())
+        if os.path.exists(llm_cache_path):
+            for path in (llm_cache_path, f"{llm_cache_path}-wal", f"{llm_cache_path}-shm"):
+                if os.path.exists(path):
+                    os.remove(path)
+            self.console.print(f"[bold green]LLM response cache deleted: {llm_cache_path}[/bold green]")
+        
         # Delete report files if they exist
         if not args.keep_config:
             reports_path = self.config.get_reports_path()
             if os.path.exists(reports_path):
-                for file in os.listdir(reports_path):
-                    if file.startswith("report_") and file.endswith(".json"):
-                        os.remove(os.path.join(reports_path, file))
+                with os.scandir(reports_path) as entries:
+                    for entry in entries:
+                        if entry.name.startswith("report_") and entry.name.endswith(".json"):
+                            os.unlink(entry.path)
                 self.console.print(f"[bold green]Report files deleted from: {reports_path}[/bold green]")
         
         # Reconnect to create a fresh database
+        from litlum.db.database import Database
         self.db = Database(self.config.get_database_path())
         self.console.print("[bold green]Database reset complete. Fresh database created.[/bold green]")
     
@@ -467,24 +527,29 @@ class CLI:
         Args:
             args: Parsed arguments
         """
+        # The later steps share one set of arguments
+        step_args = argparse.Namespace(
+            date=None,
+            reanalyze=args.reanalyze,
+            generate=True,
+            serve=getattr(args, 'serve', False)
+        )
+        
         # Fetch publications
         self.console.print("[bold]Step 1: Fetching publications...[/bold]")
         self._handle_fetch(args)
         
         # Analyze publications
         self.console.print("\n[bold]Step 2: Analyzing publications...[/bold]")
-        analyze_args = argparse.Namespace(date=None, reanalyze=False)
-        self._handle_analyze(analyze_args)
+        self._handle_analyze(step_args)
         
         # Generate report
         self.console.print("\n[bold]Step 3: Generating report...[/bold]")
-        report_args = argparse.Namespace(date=None, generate=True)
-        self._handle_report(report_args)
+        self._handle_report(step_args)
         
         # Generate static website
         self.console.print("\n[bold]Step 4: Generating static website...[/bold]")
-        web_args = argparse.Namespace(serve=getattr(args, 'serve', False))
-        self._handle_web(web_args)
+        self._handle_web(step_args)
         
     def _handle_web(self, args: argparse.Namespace) -> None:
         """Handle the web command.
@@ -496,6 +561,8 @@ class CLI:
             SpinnerColumn(),
             TextColumn("[bold blue]Generating static website..."),
             transient=True,
+            console=self.console,
+            disable=not self.console.is_terminal
         ) as progress:
             progress.add_task("Generating", total=None)
             self.site_generator.generate_site()
@@ -504,10 +571,9 @@ class CLI:
         
         # Start a local web server if requested
         if args.serve:
-            import http.server
-            import socketserver
             import threading
             import webbrowser
+            from litlum.web.server import create_server
             
             web_path = self.config.get_web_path()
             port = 8000
@@ -516,16 +582,12 @@ class CLI:
             self.console.print(f"[bold blue]Open your browser at: http://localhost:{port}[/bold blue]")
             self.console.print("Press Ctrl+C to stop the server.\n")
             
-            # Change to the web directory
-            os.chdir(web_path)
+            # Start the server before opening the browser so the first request is accepted
+            httpd = create_server(web_path, "localhost", port)
             
             # Open browser after a short delay
             threading.Timer(1.0, lambda: webbrowser.open(f"http://localhost:{port}")).start()
             
-            # Start the server
-            Handler = http.server.SimpleHTTPRequestHandler
-            httpd = socketserver.TCPServer(("localhost", port), Handler)
-            
             try:
                 httpd.serve_forever()
             except KeyboardInterrupt:
@@ -2,14 +2,52 @@
 
 import os
 import argparse
-import http.server
-import socketserver
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 from litlum.config import Config
 
 
+class StaticFileHandler(SimpleHTTPRequestHandler):
+    """Static file handler that sends file bodies with sendfile."""
+    
+    def copyfile(self, source, outputfile) -> None:
+        """Copy a file to the client.
+        
+        socket.sendfile uses os.sendfile where available, so file contents
+        go from the page cache to the socket without passing through
+        Python, and falls back to plain sends otherwise.
+        
+        Args:
+            source: File object opened for reading in binary mode
+            outputfile: Output stream for the client connection
+        """
+        outputfile.flush()
+        self.connection.sendfile(source)
+
+
+def create_server(web_path: Union[str, Path], host: str = "", port: int = 8080) -> ThreadingHTTPServer:
+    """Create a threaded HTTP server serving files from a directory.
+    
+    Requests are handled on their own threads, and files are served from
+    web_path without changing the working directory of the process.
+    
+    Args:
+        web_path: Directory to serve files from
+        host: Host to bind to
+        port: Port to bind to
+        
+    Returns:
+        HTTP server ready to serve_forever
+    """
+    handler = partial(StaticFileHandler, directory=str(web_path))
+    httpd = ThreadingHTTPServer((host, port), handler)
+    httpd.daemon_threads = True
+    return httpd
+
+
 def run_server(web_path: Optional[str] = None, port: int = 8080) -> None:
     """Run a simple HTTP server for the static website.
     
@@ -19,7 +57,7 @@ def run_server(web_path: Optional[str] = None, port: int = 8080) -> None:
     """
     # If no web path is provided, use the one from config
     if not web_path:
-        config = Config()
+        config = Config.instance()
         web_path = config.get_web_path()
     
     # Ensure the path exists
@@ -35,12 +73,8 @@ def run_server(web_path: Optional[str] = None, port: int = 8080) -> None:
         print(f"Warning: No index.html found in {web_path}")
         print("The website may not display correctly")
     
-    # Change to the web directory
-    os.chdir(web_path)
-    
     # Start the server
-    handler = http.server.SimpleHTTPRequestHandler
-    httpd = socketserver.TCPServer(("", port), handler)
+    httpd = create_server(web_path, "", port)
     
     print(f"Starting server at http://localhost:{port}")
     print(f"Serving files from {web_path}")
@@ -1,12 +1,147 @@
 """Static site generator for LitLum reports."""
 
 import os
-import json
 import shutil
 from datetime import datetime
+from functools import lru_cache
+from html import escape
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-import re
+from string import Template
+from typing import Dict, List, Any, Tuple
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+from ..text import clean_abstract
+
+# Page templates, parsed once at import
+INDEX_TEMPLATE = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>LitLum - Reports</title>
+    <link rel="stylesheet" href="assets/styles.css">
+</head>
+<body>
+    <header>
+        <div class="container">
+            <h1>LitLum</h1>
+            <p>Scientific Publication Reports</p>
+        </div>
+    </header>
+    
+    <main class="container">
+        <h2>Available Reports</h2>
+        
+        <div class="reports-grid">
+            ${REPORTS_LIST}
+        </div>
+    </main>
+    
+    <footer>
+        <div class="container">
+            <p>&copy; 2025 LitLum</p>
+        </div>
+    </footer>
+    
+    <script src="assets/scripts.js"></script>
+</body>
+</html>""")
+
+REPORT_TEMPLATE = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Report - ${REPORT_DATE} - LitLum</title>
+    <link rel="stylesheet" href="assets/styles.css">
+</head>
+<body>
+    <header>
+        <div class="container">
+            <h1>LitLum</h1>
+            <p>Scientific Publication Reports</p>
+        </div>
+    </header>
+    
+    <main class="container">
+        <div class="report-header">
+            <h2>Report: ${REPORT_DATE}</h2>
+            <a href="index.html" class="back-button">← Back to Reports</a>
+        </div>
+        
+        <div class="report-summary">
+            <h3>Summary</h3>
+            <p>${REPORT_SUMMARY}</p>
+        </div>
+        
+        <div class="publications-section">
+            <h3>Publications</h3>
+            ${PUBLICATIONS_TABLE}
+        </div>
+    </main>
+    
+    <footer>
+        <div class="container">
+            <p>&copy; 2025 LitLum</p>
+        </div>
+    </footer>
+    
+    <script src="assets/scripts.js"></script>
+</body>
+</html>""")
+
+# Bundled CSS and JS copied into every generated site
+ASSETS_DIR = os.path.join(os.path.dirname(__file__), "assets")
+
+# Modification time of this module, which holds the page templates. Pages
+# older than this are regenerated even if their report has not changed.
+_TEMPLATE_MTIME_NS = os.stat(__file__).st_mtime_ns
+
+# Fixed parts of the publications table on report pages
+PUBLICATIONS_TABLE_HEADER = """
+            <table class="publications-table">
+                <thead>
+                    <tr>
+                        <th>Title</th>
+                        <th>Journal</th>
+                        <th>Score</th>
+                        <th>Actions</th>
+                    </tr>
+                </thead>
+                <tbody>
+            """
+
+PUBLICATIONS_TABLE_FOOTER = """
+                </tbody>
+            </table>
+            """
+
+NO_PUBLICATIONS_HTML = """
+            <div class="no-publications">
+                <p>No publications available in this report.</p>
+            </div>
+            """
+
+
+@lru_cache(maxsize=None)
+def _display_date(date_str: str) -> str:
+    """Format a report date for display.
+    
+    Args:
+        date_str: Date string in ISO format (YYYY-MM-DD)
+        
+    Returns:
+        Date like "May 30, 2025", or date_str unchanged if it is not a valid date
+    """
+    try:
+        return datetime.fromisoformat(date_str).strftime("%B %d, %Y")
+    except ValueError:
+        return date_str
+
 
 class StaticSiteGenerator:
     """Generate static HTML pages for LitLum reports."""
@@ -20,7 +155,10 @@ class StaticSiteGenerator:
         """
         self.reports_path = os.path.expanduser(reports_path)
         self.output_path = os.path.expanduser(output_path)
-        self.assets_dir = os.path.join(os.path.dirname(__file__), "assets")
+        self.assets_dir = ASSETS_DIR
+        self._reports_dir = Path(self.reports_path)
+        self._output_dir = Path(self.output_path)
+        self._assets_output_dir = self._output_dir / "assets"
         
     def generate_site(self) -> None:
         """Generate the complete static website."""
@@ -30,37 +168,49 @@ class StaticSiteGenerator:
         # Copy static assets
         self._copy_assets()
         
-        # Get all reports
-        reports = self._get_reports()
+        # Load all reports once for both the index and the report pages
+        reports = []
+        for report_date in self._get_reports():
+            report = self._load_report(report_date)
+            if report:
+                reports.append((report_date, report))
         
         # Generate index page
         self._generate_index_page(reports)
         
-        # Generate individual report pages
-        for report_date in reports:
-            self._generate_report_page(report_date)
+        # Generate report pages whose report or templates changed since the last build
+        for report_date, report in reports:
+            if self._is_page_current(report_date):
+                continue
+            self._generate_report_page(report_date, report)
             
         print(f"Static site generated at: {self.output_path}")
             
     def _copy_assets(self) -> None:
         """Copy static assets to the output directory."""
         # Create assets directory if it doesn't exist
-        assets_output = os.path.join(self.output_path, "assets")
-        os.makedirs(assets_output, exist_ok=True)
-        
-        # Copy CSS file
-        css_src = os.path.join(self.assets_dir, "styles.css")
-        css_dest = os.path.join(assets_output, "styles.css")
+        self._assets_output_dir.mkdir(parents=True, exist_ok=True)
         
-        if os.path.exists(css_src):
-            shutil.copy2(css_src, css_dest)
-        
-        # Copy JS file
-        js_src = os.path.join(self.assets_dir, "scripts.js")
-        js_dest = os.path.join(assets_output, "scripts.js")
-        
-        if os.path.exists(js_src):
-            shutil.copy2(js_src, js_dest)
+        # Copy CSS and JS files, skipping copies that are already up to date.
+        # copy2 preserves mtimes, so an unchanged asset has a matching size and mtime.
+        for name in ("styles.css", "scripts.js"):
+            src = os.path.join(self.assets_dir, name)
+            dest = self._assets_output_dir / name
+            
+            try:
+                src_stat = os.stat(src)
+            except FileNotFoundError:
+                continue
+            
+            try:
+                dest_stat = os.stat(dest)
+                if (dest_stat.st_size == src_stat.st_size
+                        and dest_stat.st_mtime_ns == src_stat.st_mtime_ns):
+                    continue
+            except FileNotFoundError:
+                pass
+            
+            shutil.copy2(src, dest)
             
     def _get_reports(self) -> List[str]:
         """Get all available reports.
@@ -68,13 +218,54 @@ class StaticSiteGenerator:
         Returns:
             List of report dates sorted by date (newest first)
         """
-        reports = []
-        for file in os.listdir(self.reports_path):
-            if file.startswith("report_") and file.endswith(".json"):
-                date_str = file[7:-5]  # Extract date from filename
-                reports.append(date_str)
+        with os.scandir(self.reports_path) as entries:
+            reports = [
+                entry.name[7:-5]  # Extract date from filename
+                for entry in entries
+                if entry.name.startswith("report_") and entry.name.endswith(".json") and entry.is_file()
+            ]
+        
+        reports.sort(reverse=True)
+        return reports
+    
+    def _report_file(self, report_date: str) -> Path:
+        """Get the path of a report's JSON file.
         
-        return sorted(reports, reverse=True)
+        Args:
+            report_date: Date string in ISO format (YYYY-MM-DD)
+            
+        Returns:
+            Path of the report file in the reports directory
+        """
+        return self._reports_dir / f"report_{report_date}.json"
+    
+    def _page_file(self, report_date: str) -> Path:
+        """Get the path of a report's HTML page.
+        
+        Args:
+            report_date: Date string in ISO format (YYYY-MM-DD)
+            
+        Returns:
+            Path of the report page in the output directory
+        """
+        return self._output_dir / f"report_{report_date}.html"
+    
+    def _is_page_current(self, report_date: str) -> bool:
+        """Check whether a report page is newer than its report and the templates.
+        
+        Args:
+            report_date: Date string in ISO format (YYYY-MM-DD)
+            
+        Returns:
+            True if the existing page can be kept, False if it must be generated
+        """
+        try:
+            page_mtime = self._page_file(report_date).stat().st_mtime_ns
+            report_mtime = self._report_file(report_date).stat().st_mtime_ns
+        except FileNotFoundError:
+            return False
+        
+        return page_mtime > max(report_mtime, _TEMPLATE_MTIME_NS)
     
     def _load_report(self, report_date: str) -> Dict[str, Any]:
         """Load a report from disk.
@@ -85,44 +276,35 @@ class StaticSiteGenerator:
         Returns:
             Report data dictionary or empty dict if not found
         """
-        report_file = os.path.join(self.reports_path, f"report_{report_date}.json")
+        report_file = self._report_file(report_date)
         
-        if not os.path.exists(report_file):
+        if not report_file.exists():
             return {}
         
-        with open(report_file, 'r') as f:
-            return json.load(f)
+        with open(report_file, 'rb') as f:
+            return _json_loads(f.read())
     
-    def _generate_index_page(self, report_dates: List[str]) -> None:
+    def _generate_index_page(self, reports: List[Tuple[str, Dict[str, Any]]]) -> None:
         """Generate the index page listing all reports.
         
         Args:
-            report_dates: List of report dates
+            reports: List of (report date, report data) tuples
         """
-        html = self._get_html_template("index")
-        
         # Generate report list HTML
-        reports_html = ""
-        for date_str in report_dates:
-            report = self._load_report(date_str)
-            if not report:
-                continue
-                
-            # Format date for display
-            try:
-                display_date = datetime.fromisoformat(date_str).strftime("%B %d, %Y")
-            except ValueError:
-                display_date = date_str
-                
+        cards = []
+        for date_str, report in reports:
+            display_date = _display_date(date_str)
             pub_count = len(report.get('publications', []))
             
-            reports_html += f"""
+            cards.append(f"""
             <div class="report-card">
                 <div class="report-date">{display_date}</div>
                 <div class="report-count">{pub_count} publications</div>
                 <a href="report_{date_str}.html" class="view-button">View Report</a>
             </div>
-            """
+            """)
+        
+        reports_html = "".join(cards)
         
         # If no reports, show message
         if not reports_html:
@@ -132,58 +314,32 @@ class StaticSiteGenerator:
             </div>
             """
             
-        # Replace placeholder with report list
-        html = html.replace("{{REPORTS_LIST}}", reports_html)
+        # Fill in the page template
+        html = INDEX_TEMPLATE.substitute(REPORTS_LIST=reports_html)
         
         # Write to file
-        with open(os.path.join(self.output_path, "index.html"), "w") as f:
-            f.write(html)
+        (self._output_dir / "index.html").write_bytes(html.encode("utf-8"))
     
-    def _generate_report_page(self, report_date: str) -> None:
+    def _generate_report_page(self, report_date: str, report: Dict[str, Any]) -> None:
         """Generate a page for a single report.
         
         Args:
             report_date: Date string in ISO format (YYYY-MM-DD)
+            report: Report data dictionary
         """
-        report = self._load_report(report_date)
-        if not report:
-            return
-            
-        html = self._get_html_template("report")
+        display_date = _display_date(report_date)
         
-        # Format date for display
-        try:
-            display_date = datetime.fromisoformat(report_date).strftime("%B %d, %Y")
-        except ValueError:
-            display_date = report_date
-            
-        # Replace report date
-        html = html.replace("{{REPORT_DATE}}", display_date)
-        
-        # Replace report summary
-        summary = report.get('summary', 'No summary available')
-        html = html.replace("{{REPORT_SUMMARY}}", summary)
+        report_summary = escape(report.get('summary', 'No summary available'))
         
         # Generate publications table
         publications = report.get('publications', [])
         
         if publications:
-            pubs_html = """
-            <table class="publications-table">
-                <thead>
-                    <tr>
-                        <th>Title</th>
-                        <th>Journal</th>
-                        <th>Score</th>
-                        <th>Actions</th>
-                    </tr>
-                </thead>
-                <tbody>
-            """
+            parts = [PUBLICATIONS_TABLE_HEADER]
             
             for i, pub in enumerate(publications):
-                title = pub.get('title', 'Untitled')
-                journal = pub.get('journal', 'Unknown')
+                title = escape(pub.get('title') or 'Untitled')
+                journal = escape(pub.get('journal') or 'Unknown')
                 score = pub.get('relevance_score', 0)
                 pub_id = f"pub_{i}"
                 
@@ -199,14 +355,15 @@ class StaticSiteGenerator:
                 doi_link = ""
                 url = pub.get('url', '')
                 if url:
-                    doi_link = f'<a href="{url}" target="_blank" class="doi-link">View Paper</a>'
+                    doi_link = f'<a href="{escape(url)}" target="_blank" class="doi-link">View Paper</a>'
                 
                 # Prepare summary for details section
-                summary = pub.get('llm_summary', 'No summary available')
-                abstract = pub.get('abstract', 'No abstract available')
+                summary = escape(pub.get('llm_summary') or 'No summary available')
+                # Abstracts stored by older versions may still hold raw JATS markup
+                abstract = escape(clean_abstract(pub.get('abstract') or '') or 'No abstract available')
                 
                 # Create table row
-                pubs_html += f"""
+                parts.append(f"""
                 <tr>
                     <td>{title}</td>
                     <td>{journal}</td>
@@ -226,111 +383,19 @@ class StaticSiteGenerator:
                         </div>
                     </td>
                 </tr>
-                """
+                """)
                 
-            pubs_html += """
-                </tbody>
-            </table>
-            """
+            parts.append(PUBLICATIONS_TABLE_FOOTER)
+            pubs_html = "".join(parts)
         else:
-            pubs_html = """
-            <div class="no-publications">
-                <p>No publications available in this report.</p>
-            </div>
-            """
+            pubs_html = NO_PUBLICATIONS_HTML
             
-        # Replace publications table
-        html = html.replace("{{PUBLICATIONS_TABLE}}", pubs_html)
+        # Fill in the page template
+        html = REPORT_TEMPLATE.substitute(
+            REPORT_DATE=display_date,
+            REPORT_SUMMARY=report_summary,
+            PUBLICATIONS_TABLE=pubs_html
+        )
         
         # Write to file
-        with open(os.path.join(self.output_path, f"report_{report_date}.html"), "w") as f:
-            f.write(html)
-    
-    def _get_html_template(self, template_name: str) -> str:
-        """Get an HTML template.
-        
-        Args:
-            template_name: Name of the template ('index' or 'report')
-            
-        Returns:
-            HTML template as string
-        """
-        if template_name == "index":
-            return """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>LitLum - Reports</title>
-    <link rel="stylesheet" href="assets/styles.css">
-</head>
-<body>
-    <header>
-        <div class="container">
-            <h1>LitLum</h1>
-            <p>Scientific Publication Reports</p>
-        </div>
-    </header>
-    
-    <main class="container">
-        <h2>Available Reports</h2>
-        
-        <div class="reports-grid">
-            {{REPORTS_LIST}}
-        </div>
-    </main>
-    
-    <footer>
-        <div class="container">
-            <p>&copy; 2025 LitLum</p>
-        </div>
-    </footer>
-    
-    <script src="assets/scripts.js"></script>
-</body>
-</html>"""
-        elif template_name == "report":
-            return """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Report - {{REPORT_DATE}} - LitLum</title>
-    <link rel="stylesheet" href="assets/styles.css">
-</head>
-<body>
-    <header>
-        <div class="container">
-            <h1>LitLum</h1>
-            <p>Scientific Publication Reports</p>
-        </div>
-    </header>
-    
-    <main class="container">
-        <div class="report-header">
-            <h2>Report: {{REPORT_DATE}}</h2>
-            <a href="index.html" class="back-button">← Back to Reports</a>
-        </div>
-        
-        <div class="report-summary">
-            <h3>Summary</h3>
-            <p>{{REPORT_SUMMARY}}</p>
-        </div>
-        
-        <div class="publications-section">
-            <h3>Publications</h3>
-            {{PUBLICATIONS_TABLE}}
-        </div>
-    </main>
-    
-    <footer>
-        <div class="container">
-            <p>&copy; 2025 LitLum</p>
-        </div>
-    </footer>
-    
-    <script src="assets/scripts.js"></script>
-</body>
-</html>"""
-        else:
-            return ""
+        self._page_file(report_date).write_bytes(html.encode("utf-8"))
@@ -3,13 +3,54 @@
 Test runner for publication_reader.
 Run all tests with:
     python run_tests.py
+Run test modules in parallel worker processes with:
+    python run_tests.py --parallel
 """
 
+import argparse
 import unittest
 import sys
 from pathlib import Path
 
 
+def run_tests_parallel() -> int:
+    """Run all tests in the tests directory across CPU cores.
+    
+    Uses pytest-xdist when it is installed, otherwise runs each test module
+    with unittest in a separate process.
+    
+    Returns:
+        Process exit code (0 if all tests passed)
+    """
+    try:
+        import pytest
+        import xdist  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        return int(pytest.main(["-n", "auto", "-q", "tests"]))
+    
+    import subprocess
+    from concurrent.futures import ThreadPoolExecutor
+    
+    modules = [f"tests.{path.stem}" for path in sorted(Path("tests").glob("test_*.py"))]
+    
+    def run_module(module: str) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [sys.executable, "-m", "unittest", module],
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+        )
+    
+    with ThreadPoolExecutor() as executor:
+        results = list(executor.map(run_module, modules))
+    
+    for module, result in zip(modules, results):
+        print(f"== {module} ==")
+        print(result.stdout)
+    
+    return 0 if all(result.returncode == 0 for result in results) else 1
+
+
 def run_tests():
     """Run all tests in the tests directory."""
     # Discover and run tests
@@ -25,4 +66,9 @@ def run_tests():
 
 
 if __name__ == "__main__":
-    sys.exit(run_tests())
+    parser = argparse.ArgumentParser(description="Run the LitLum test suite")
+    parser.add_argument("--parallel", action="store_true",
+                        help="Run test modules in parallel worker processes")
+    args = parser.parse_args()
+    
+    sys.exit(run_tests_parallel() if args.parallel else run_tests())
@@ -15,34 +15,34 @@ def test_crossref_parser():
     parser = FeedParser()
     
     # Get the configuration
-    config = Config()
+    config = Config.instance()
     feeds = config.get_feeds()
     
+    # Fetch all CrossRef feeds concurrently, then report them in config order
+    crossref_feeds = [feed for feed in feeds if feed.get('type') == 'crossref']
+    results = parser.parse_feeds(crossref_feeds)
+    
     # Test each CrossRef feed
-    for feed in feeds:
-        if feed.get('type') == 'crossref':
-            print(f"\nTesting CrossRef API for journal: {feed.get('name')} (ISSN: {feed.get('issn')})")
-            
-            # Parse the feed
-            publications = parser.parse_feed(feed)
-            
-            # Print summary
-            print(f"Found {len(publications)} publications")
-            
-            # Print first publication details (if any)
-            if publications:
-                print("\nFirst publication details:")
-                first_pub = publications[0]
-                pprint({
-                    'title': first_pub.get('title'),
-                    'journal': first_pub.get('journal'),
-                    'doi': first_pub.get('doi'),
-                    'url': first_pub.get('url'),
-                    'pub_date': first_pub.get('pub_date'),
-                    'abstract_preview': first_pub.get('abstract', '')[:150] + '...' if first_pub.get('abstract') else 'No abstract'
-                })
-            else:
-                print("No publications found")
+    for feed, publications in zip(crossref_feeds, results):
+        print(f"\nTesting CrossRef API for journal: {feed.get('name')} (ISSN: {feed.get('issn')})")
+        
+        # Print summary
+        print(f"Found {len(publications)} publications")
+        
+        # Print first publication details (if any)
+        if publications:
+            print("\nFirst publication details:")
+            first_pub = publications[0]
+            pprint({
+                'title': first_pub.get('title'),
+                'journal': first_pub.get('journal'),
+                'doi': first_pub.get('doi'),
+                'url': first_pub.get('url'),
+                'pub_date': first_pub.get('pub_date'),
+                'abstract_preview': first_pub.get('abstract', '')[:150] + '...' if first_pub.get('abstract') else 'No abstract'
+            })
+        else:
+            print("No publications found")
 
 if __name__ == "__main__":
     test_crossref_parser()
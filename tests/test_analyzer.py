@@ -5,12 +5,19 @@ from unittest.mock import patch, MagicMock
 import os
 import sys
 import re
+import tempfile
+import threading
+from io import StringIO
 from pathlib import Path
 
+from rich.console import Console
+
 # Add the project root directory to the Python path
 sys.path.append(str(Path(__file__).parent.parent))
 
+from litlum.llm import analyzer as analyzer_module
 from litlum.llm.analyzer import OllamaAnalyzer
+from litlum.llm.cache import ResponseCache
 
 
 class TestOllamaAnalyzer(unittest.TestCase):
@@ -27,7 +34,7 @@ class TestOllamaAnalyzer(unittest.TestCase):
         }
         self.analyzer = OllamaAnalyzer(self.mock_config)
 
-    @patch('ollama.chat')
+    @patch('ollama.Client.chat')
     def test_extract_relevance_standard_format(self, mock_ollama_chat):
         """Test extracting relevance score from standard 'N/10' format."""
         # Mock the ollama.chat response
@@ -38,7 +45,7 @@ class TestOllamaAnalyzer(unittest.TestCase):
         relevance, explanation = self.analyzer._determine_relevance("Test Title", "Test Abstract")
         self.assertEqual(relevance, 7)
 
-    @patch('ollama.chat')
+    @patch('ollama.Client.chat')
     def test_extract_relevance_with_colon(self, mock_ollama_chat):
         """Test extracting relevance score from 'Relevance: N' format."""
         # Mock the ollama.chat response
@@ -49,7 +56,7 @@ class TestOllamaAnalyzer(unittest.TestCase):
         relevance, explanation = self.analyzer._determine_relevance("Test Title", "Test Abstract")
         self.assertEqual(relevance, 8)
 
-    @patch('ollama.chat')
+    @patch('ollama.Client.chat')
     def test_extract_relevance_with_is(self, mock_ollama_chat):
         """Test extracting relevance score from 'relevance is N' format."""
         # Mock the ollama.chat response
@@ -60,7 +67,7 @@ class TestOllamaAnalyzer(unittest.TestCase):
         relevance, explanation = self.analyzer._determine_relevance("Test Title", "Test Abstract")
         self.assertEqual(relevance, 5)
 
-    @patch('ollama.chat')
+    @patch('ollama.Client.chat')
     def test_extract_relevance_from_score_word(self, mock_ollama_chat):
         """Test extracting relevance score from 'score N' format."""
         # Mock the ollama.chat response
@@ -71,7 +78,7 @@ class TestOllamaAnalyzer(unittest.TestCase):
         relevance, explanation = self.analyzer._determine_relevance("Test Title", "Test Abstract")
         self.assertEqual(relevance, 9)
 
-    @patch('ollama.chat')
+    @patch('ollama.Client.chat')
     def test_extract_relevance_fallback(self, mock_ollama_chat):
         """Test extracting relevance score using fallback method (any number)."""
         # Mock the ollama.chat response
@@ -82,7 +89,7 @@ class TestOllamaAnalyzer(unittest.TestCase):
         relevance, explanation = self.analyzer._determine_relevance("Test Title", "Test Abstract")
         self.assertEqual(relevance, 6)
 
-    @patch('ollama.chat')
+    @patch('ollama.Client.chat')
     def test_no_relevance_found(self, mock_ollama_chat):
         """Test handling case where no relevance score is found."""
         # Mock the ollama.chat response with no clear score
@@ -93,7 +100,7 @@ class TestOllamaAnalyzer(unittest.TestCase):
         relevance, explanation = self.analyzer._determine_relevance("Test Title", "Test Abstract")
         self.assertEqual(relevance, 0)  # Should default to 0 if no score found
 
-    @patch('ollama.chat')
+    @patch('ollama.Client.chat')
     def test_extract_explanation(self, mock_ollama_chat):
         """Test extracting the explanation from the LLM response."""
         # Mock the ollama.chat response with an explanation
@@ -105,6 +112,194 @@ class TestOllamaAnalyzer(unittest.TestCase):
         self.assertEqual(relevance, 8)
         self.assertIn("highly relevant", explanation)
 
+    @patch('ollama.Client.chat')
+    def test_analyze_publication_single_request(self, mock_ollama_chat):
+        """Test that relevance and summary come from one JSON-mode request."""
+        mock_ollama_chat.return_value = {
+            'message': {'content': '{"score": 8, "explanation": "Matches interests.", "summary": "Short summary."}'}
+        }
+        publication = {'title': 'Test Title', 'abstract': 'Test Abstract', 'journal': 'Test Journal'}
+        
+        relevance, summary = self.analyzer.analyze_publication(publication)
+        
+        self.assertEqual(relevance, 8)
+        self.assertEqual(summary, "Short summary.")
+        self.assertEqual(mock_ollama_chat.call_count, 1)
+        self.assertEqual(mock_ollama_chat.call_args[1]['format'], 'json')
+        
+        # Fixed instructions go in the system message, the paper in the user message
+        system, user = mock_ollama_chat.call_args[1]['messages']
+        self.assertEqual(system['role'], 'system')
+        self.assertIn("test interest", system['content'])
+        self.assertNotIn("Test Abstract", system['content'])
+        self.assertIn("Test Abstract", user['content'])
+
+    @patch('ollama.Client.chat')
+    def test_analyze_publication_falls_back_without_json(self, mock_ollama_chat):
+        """Test that a non-JSON reply falls back to separate relevance and summary requests."""
+        mock_ollama_chat.side_effect = [
+            {'message': {'content': 'not json'}},
+            {'message': {'content': 'I would rate this 9/10.'}},
+            {'message': {'content': 'Fallback summary.'}},
+        ]
+        publication = {'title': 'Test Title', 'abstract': 'Test Abstract', 'journal': 'Test Journal'}
+        
+        relevance, summary = self.analyzer.analyze_publication(publication)
+        
+        self.assertEqual(relevance, 9)
+        self.assertEqual(summary, "Fallback summary.")
+        self.assertEqual(mock_ollama_chat.call_count, 3)
+
+    @patch('ollama.Client.chat')
+    def test_analyze_publication_missing_summary(self, mock_ollama_chat):
+        """Test that a JSON reply without a summary gets a separate summary request."""
+        mock_ollama_chat.side_effect = [
+            {'message': {'content': '{"score": 8, "explanation": "Matches interests."}'}},
+            {'message': {'content': 'Separate summary.'}},
+        ]
+        publication = {'title': 'Test Title', 'abstract': 'Test Abstract', 'journal': 'Test Journal'}
+        
+        relevance, summary = self.analyzer.analyze_publication(publication)
+        
+        self.assertEqual(relevance, 8)
+        self.assertEqual(summary, "Separate summary.")
+        self.assertEqual(mock_ollama_chat.call_count, 2)
+
+    @patch('ollama.Client.chat')
+    def test_cached_response_reused(self, mock_ollama_chat):
+        """Test that an identical request is answered from the response cache."""
+        mock_ollama_chat.return_value = {
+            'message': {'content': '{"score": 6, "explanation": "Related.", "summary": "Cached summary."}'}
+        }
+        publication = {'title': 'Test Title', 'abstract': 'Test Abstract', 'journal': 'Test Journal'}
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ResponseCache(os.path.join(temp_dir, 'llm-cache.db'))
+            analyzer = OllamaAnalyzer(self.mock_config, cache=cache)
+            first = analyzer.analyze_publication(publication)
+            second = analyzer.analyze_publication(publication)
+            cache.close()
+        
+        self.assertEqual(first, second)
+        self.assertEqual(mock_ollama_chat.call_count, 1)
+
+    @patch('ollama.Client.chat')
+    def test_cache_not_read_when_disabled(self, mock_ollama_chat):
+        """Test that read_cache=False asks the model again and refreshes the cache."""
+        mock_ollama_chat.side_effect = [
+            {'message': {'content': '{"score": 6, "explanation": "Related.", "summary": "Old summary."}'}},
+            {'message': {'content': '{"score": 8, "explanation": "Related.", "summary": "New summary."}'}},
+        ]
+        publication = {'title': 'Test Title', 'abstract': 'Test Abstract', 'journal': 'Test Journal'}
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ResponseCache(os.path.join(temp_dir, 'llm-cache.db'))
+            analyzer = OllamaAnalyzer(self.mock_config, cache=cache)
+            analyzer.analyze_publication(publication)
+            analyzer.read_cache = False
+            refreshed = analyzer.analyze_publication(publication)
+            analyzer.read_cache = True
+            cached = analyzer.analyze_publication(publication)
+            cache.close()
+        
+        self.assertEqual(refreshed, (8, "New summary."))
+        self.assertEqual(cached, refreshed)
+        self.assertEqual(mock_ollama_chat.call_count, 2)
+
+    @patch('ollama.Client.chat')
+    def test_short_abstract_skipped(self, mock_ollama_chat):
+        """Test that abstracts below min_abstract_chars are not sent to the LLM."""
+        analyzer = OllamaAnalyzer(dict(self.mock_config, min_abstract_chars=50))
+        
+        relevance, summary = analyzer.analyze_publication({'title': 'Test Title', 'abstract': 'Too short.'})
+        
+        self.assertEqual(relevance, 0)
+        self.assertIn("Insufficient abstract", summary)
+        mock_ollama_chat.assert_not_called()
+
+    @patch('ollama.Client.chat')
+    def test_prefilter_skips_unrelated_publication(self, mock_ollama_chat):
+        """Test that the keyword prefilter skips the LLM for unrelated papers."""
+        mock_ollama_chat.return_value = {
+            'message': {'content': '{"score": 7, "explanation": "Related.", "summary": "Summary."}'}
+        }
+        analyzer = OllamaAnalyzer(dict(self.mock_config, prefilter=True, interests=["sea ice"]))
+        
+        relevance, _ = analyzer.analyze_publication({'title': 'Soil bacteria', 'abstract': 'Microbes in soil.'})
+        self.assertEqual(relevance, 0)
+        mock_ollama_chat.assert_not_called()
+        
+        relevance, _ = analyzer.analyze_publication({'title': 'Arctic Sea Ice loss', 'abstract': 'Melting.'})
+        self.assertEqual(relevance, 7)
+        mock_ollama_chat.assert_called_once()
+
+    @patch('ollama.Client.generate')
+    def test_warm_up(self, mock_generate):
+        """Test that warm_up loads the model and survives an unreachable server."""
+        self.analyzer.warm_up()
+        mock_generate.assert_called_once_with(model="llama3.2", prompt='', keep_alive='30m')
+        
+        mock_generate.side_effect = ConnectionError("refused")
+        self.analyzer.warm_up()
+
+    @patch.object(OllamaAnalyzer, 'analyze_publication')
+    def test_iter_analyzed_publications(self, mock_analyze):
+        """Test that every publication is analyzed and paired with its result."""
+        mock_analyze.side_effect = lambda pub: (pub['id'], f"Summary {pub['id']}")
+        publications = [{'id': i, 'title': f'Title {i}', 'abstract': 'Abstract'} for i in range(5)]
+        
+        results = list(self.analyzer.iter_analyzed_publications(publications))
+        
+        self.assertEqual(len(results), 5)
+        for pub, (relevance, summary) in results:
+            self.assertEqual(relevance, pub['id'])
+            self.assertEqual(summary, f"Summary {pub['id']}")
+
+    @patch.object(OllamaAnalyzer, 'analyze_publication')
+    def test_iter_analyzed_publications_deduplicates(self, mock_analyze):
+        """Test that publications with the same title and abstract are analyzed once."""
+        mock_analyze.return_value = (6, "Summary")
+        publications = [
+            {'id': 1, 'title': 'Same Title', 'abstract': 'Abstract'},
+            {'id': 2, 'title': 'same title ', 'abstract': 'Abstract'},
+            {'id': 3, 'title': 'Other Title', 'abstract': 'Abstract'},
+        ]
+        
+        results = list(self.analyzer.iter_analyzed_publications(publications))
+        
+        self.assertEqual(sorted(pub['id'] for pub, _ in results), [1, 2, 3])
+        self.assertEqual(mock_analyze.call_count, 2)
+
+    @patch('ollama.Client.chat')
+    def test_concurrent_output_not_interleaved(self, mock_ollama_chat):
+        """Test that each publication's console output is written as one block."""
+        # All four requests are in flight before any of them returns
+        barrier = threading.Barrier(4, timeout=5)
+        
+        def chat(model, messages, **kwargs):
+            barrier.wait()
+            score = messages[-1]['content'].split('Title ')[1][0]
+            return {'message': {'content': f'{{"score": {score}, "explanation": "", "summary": "S"}}'}}
+        
+        mock_ollama_chat.side_effect = chat
+        publications = [{'id': i, 'title': f'Title {i}', 'abstract': 'Abstract'} for i in range(1, 5)]
+        output = StringIO()
+        
+        with patch.object(analyzer_module, 'console', Console(file=output, width=200)):
+            list(OllamaAnalyzer(dict(self.mock_config, concurrency=4)).iter_analyzed_publications(publications))
+        
+        blocks = output.getvalue().split('PAPER:')[1:]
+        self.assertEqual(len(blocks), 4)
+        for block in blocks:
+            score = block.split('Title ')[1][0]
+            self.assertIn(f"Final Score: {score}/10", block)
+
+    def test_extract_relevance_score_from_terms(self):
+        """Test the positive/negative term fallback when no score is present."""
+        self.assertEqual(self.analyzer._extract_relevance_score("Novel and important work."), 7)
+        # "irrelevant" also contains "relevant", which counts as positive
+        self.assertEqual(self.analyzer._extract_relevance_score("Irrelevant and unrelated."), 4)
+
     def test_create_relevance_prompt(self):
         """Test creating a relevance prompt with interests."""
         # Test the actual _create_relevance_prompt method
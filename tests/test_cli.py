@@ -0,0 +1,36 @@
+"""Tests for the command line interface."""
+
+import unittest
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add the project root directory to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from litlum.ui.cli import CLI
+
+
+class TestCLI(unittest.TestCase):
+    """Test cases for the CLI class."""
+
+    def setUp(self):
+        """Set up a CLI with a stand-in config."""
+        with patch('litlum.ui.cli.Config.instance', return_value=SimpleNamespace()):
+            self.cli = CLI()
+
+    def test_run_passes_reanalyze(self):
+        """Test that run --reanalyze reaches the analyze step."""
+        for flag, expected in ((['--reanalyze'], True), ([], False)):
+            with patch.object(CLI, '_handle_fetch'), \
+                    patch.object(CLI, '_handle_analyze') as mock_analyze, \
+                    patch.object(CLI, '_handle_report'), \
+                    patch.object(CLI, '_handle_web'):
+                self.cli.run(['run'] + flag)
+            
+            self.assertIs(mock_analyze.call_args[0][0].reanalyze, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
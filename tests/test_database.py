@@ -0,0 +1,132 @@
+"""Tests for the SQLite database module."""
+
+import unittest
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add the project root directory to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from litlum.db.database import Database
+
+
+class TestDatabase(unittest.TestCase):
+    """Test cases for the Database class."""
+
+    def setUp(self):
+        """Set up a fresh database in a temporary directory."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db = Database(os.path.join(self.tmp_dir.name, "test.db"))
+        
+        self.publications = [
+            {
+                'journal': 'JGR Oceans',
+                'title': f'Test Publication {i}',
+                'abstract': 'Test Abstract',
+                'url': f'https://doi.org/10.1029/test{i}',
+                'pub_date': '2025-05-30T00:00:00',
+                'guid': f'crossref-10.1029/test{i}'
+            }
+            for i in range(3)
+        ]
+
+    def tearDown(self):
+        """Close the database and remove the temporary directory."""
+        self.db.close()
+        self.tmp_dir.cleanup()
+
+    def test_add_publications(self):
+        """Test bulk insertion of publications."""
+        added = self.db.add_publications(self.publications)
+        
+        self.assertEqual(added, 3)
+        self.assertEqual(len(self.db.get_unprocessed_publications()), 3)
+
+    def test_add_publications_skips_existing(self):
+        """Test that bulk insertion ignores publications already stored."""
+        self.db.add_publication(self.publications[0])
+        
+        added = self.db.add_publications(self.publications)
+        
+        self.assertEqual(added, 2)
+        self.assertEqual(len(self.db.get_unprocessed_publications()), 3)
+
+    def test_update_publications_analysis(self):
+        """Test bulk update of analysis results."""
+        self.db.add_publications(self.publications)
+        pub_ids = [p['id'] for p in self.db.get_unprocessed_publications()]
+        
+        self.db.update_publications_analysis([(pub_ids[0], 8, 'Summary 0'), (pub_ids[1], 3, 'Summary 1')])
+        
+        remaining = self.db.get_unprocessed_publications()
+        self.assertEqual([p['id'] for p in remaining], [pub_ids[2]])
+        publication = self.db.get_publication_by_guid(self.publications[0]['guid'])
+        self.assertEqual(publication['relevance_score'], 8)
+        self.assertEqual(publication['llm_summary'], 'Summary 0')
+
+    def test_get_publications_by_date(self):
+        """Test that only publications processed on the given date are returned."""
+        self.db.add_publications(self.publications)
+        self.db.conn.execute(
+            "UPDATE publications SET processed_date = ? WHERE title = ?",
+            ('2025-05-31T08:00:00', 'Test Publication 0')
+        )
+        self.db.conn.execute(
+            "UPDATE publications SET processed_date = ? WHERE title != ?",
+            ('2025-05-30T23:59:59.999999', 'Test Publication 0')
+        )
+        
+        publications = self.db.get_publications_by_date('2025-05-31')
+        
+        self.assertEqual([p['title'] for p in publications], ['Test Publication 0'])
+        self.assertEqual(len(self.db.get_publications_by_date('2025-05-30')), 2)
+    
+    def test_get_publication(self):
+        """Test fetching a single publication by ID."""
+        self.db.add_publications(self.publications)
+        pub_id = self.db.get_publication_by_guid(self.publications[1]['guid'])['id']
+        
+        publication = self.db.get_publication(pub_id)
+        
+        self.assertEqual(publication['title'], 'Test Publication 1')
+        self.assertIsNone(self.db.get_publication(pub_id + 100))
+    
+    def test_get_unprocessed_publications_by_date(self):
+        """Test that analyzed publications are excluded from the date query."""
+        self.db.add_publications(self.publications)
+        self.db.conn.execute(
+            "UPDATE publications SET processed_date = ?",
+            ('2025-05-31T08:00:00',)
+        )
+        pub_id = self.db.get_publication_by_guid(self.publications[0]['guid'])['id']
+        self.db.update_publication_analysis(pub_id, 7, "Summary")
+        
+        publications = self.db.get_unprocessed_publications_by_date('2025-05-31')
+        
+        self.assertEqual(sorted(p['title'] for p in publications),
+                         ['Test Publication 1', 'Test Publication 2'])
+        self.assertEqual(self.db.get_unprocessed_publications_by_date('2025-05-30'), [])
+
+    def test_unprocessed_queries_use_partial_index(self):
+        """Test that both unprocessed queries are planned on the partial date index."""
+        queries = [
+            ("SELECT id FROM publications WHERE relevance_score IS NULL", ()),
+            ("SELECT id FROM publications WHERE processed_date >= ? "
+             "AND processed_date < date(?, '+1 day') AND relevance_score IS NULL",
+             ('2025-05-31', '2025-05-31')),
+        ]
+        
+        for query, params in queries:
+            plan = self.db.conn.execute(f"EXPLAIN QUERY PLAN {query}", params).fetchall()
+            self.assertIn("USING INDEX idx_pub_date_unproc", plan[0][-1])
+        
+        index_names = {row[0] for row in self.db.conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'"
+        )}
+        self.assertNotIn('idx_pub_relevance_null', index_names)
+
+
+if __name__ == "__main__":
+    unittest.main()
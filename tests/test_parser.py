@@ -3,26 +3,28 @@
 import unittest
 import inspect
 from unittest.mock import patch, MagicMock
-from urllib.parse import quote
+import json
 import os
 import sys
+import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 
 # Add the project root directory to the Python path
 sys.path.append(str(Path(__file__).parent.parent))
 
+from litlum.feeds.cache import FeedCache
 from litlum.feeds.parser import FeedParser
 
 
 class TestFeedParser(unittest.TestCase):
     """Test cases for the FeedParser class with CrossRef API."""
 
-    def setUp(self):
-        """Set up test environment."""
-        self.parser = FeedParser()
-        
+    @classmethod
+    def setUpClass(cls):
+        """Set up read-only fixtures shared by all tests."""
         # Sample CrossRef API response item
-        self.crossref_item = {
+        cls.crossref_item = {
             'DOI': '10.1029/2024jc021997',
             'title': ['Asymmetric Response of the North Atlantic Gyres to the North Atlantic Oscillation'],
             'abstract': '<jats:title>Abstract</jats:title><jats:p>The North Atlantic Oscillation (NAO) is a leading mode of atmospheric variability, affecting the North Atlantic Ocean circulation through changes in wind stress and buoyancy forcing.</jats:p>',
@@ -32,12 +34,23 @@ class TestFeedParser(unittest.TestCase):
         }
         
         # Sample feed configuration
-        self.feed_config = {
+        cls.feed_config = {
             'name': 'JGR Oceans',
             'type': 'crossref',
             'issn': '2169-9291'
             # No days_range specified - should use global default
         }
+        
+        # Stand-in for Config; FeedParser only reads its _config dictionary
+        cls.stub_config = SimpleNamespace(_config={
+            'crossref': {
+                'days_range': 10
+            }
+        })
+
+    def setUp(self):
+        """Set up a fresh parser, since tests change its state."""
+        self.parser = FeedParser(config=self.stub_config)
 
     def test_extract_pub_date_full(self):
         """Test extracting publication date with year, month, and day."""
@@ -77,6 +90,23 @@ class TestFeedParser(unittest.TestCase):
         # Just check that it returns an ISO formatted string
         self.assertIsInstance(result, str)
         self.assertTrue('T' in result)  # ISO format has T between date and time
+        
+        # The fallback is the parser's current date
+        from datetime import datetime
+        parser = FeedParser(config=self.stub_config, current_date=datetime(2025, 5, 31, 12, 0))
+        self.assertEqual(parser._extract_pub_date(item), "2025-05-31T12:00:00")
+
+    def test_extract_pub_date_invalid_day(self):
+        """Test that impossible dates fall back to the current date."""
+        from datetime import datetime
+        parser = FeedParser(config=self.stub_config, current_date=datetime(2025, 5, 31, 12, 0))
+        
+        for date_parts in ([2023, 2, 29], [2024, 2, 30], [2025, 4, 31]):
+            item = {'published': {'date-parts': [date_parts]}}
+            self.assertEqual(parser._extract_pub_date(item), "2025-05-31T12:00:00")
+        
+        item = {'published': {'date-parts': [[2024, 2, 29]]}}
+        self.assertEqual(parser._extract_pub_date(item), "2024-02-29T00:00:00")
 
     def test_extract_publication_data(self):
         """Test extracting publication data from CrossRef item."""
@@ -90,32 +120,18 @@ class TestFeedParser(unittest.TestCase):
         self.assertTrue('pub_date' in result)
         self.assertEqual(result['guid'], 'crossref-10.1029/2024jc021997')
 
-    @patch('requests.get')
-    @patch('litlum.feeds.parser.Config')
-    def test_parse_feed(self, mock_config, mock_get):
+    @patch('requests.Session.get')
+    def test_parse_feed(self, mock_get):
         """Test parsing CrossRef feed."""
-        # Mock config to return a global days_range of 10
-        mock_config_instance = MagicMock()
-        mock_config_instance.get.return_value = 10  # For days_range
-        mock_config_instance._config = {
-            'crossref': {
-                'days_range': 10
-            }
-        }
-        mock_config.return_value = mock_config_instance
-        
         # Create a mock response for the requests.get call
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             'message': {
                 'items': [self.crossref_item]
             }
-        }
+        }).encode()
         mock_get.return_value = mock_response
         
-        # Reset and re-initialize the parser to use our mocked config
-        self.parser = FeedParser()
-        
         # Call the parse_feed method
         result = self.parser.parse_feed(self.feed_config)
         
@@ -125,7 +141,7 @@ class TestFeedParser(unittest.TestCase):
         self.assertEqual(result[0]['journal'], 'JGR Oceans')
         self.assertEqual(result[0]['url'], 'https://doi.org/10.1029/2024jc021997')
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_parse_feed_error(self, mock_get):
         """Test error handling in parse_feed method."""
         # Create a mock response that raises an exception
@@ -137,6 +153,130 @@ class TestFeedParser(unittest.TestCase):
         # Verify the results
         self.assertEqual(result, [])
 
+    @patch('requests.Session.get')
+    def test_parse_feeds(self, mock_get):
+        """Test parsing several feeds keeps results in feed order."""
+        mock_response = MagicMock()
+        mock_response.content = json.dumps({
+            'message': {
+                'items': [self.crossref_item]
+            }
+        }).encode()
+        mock_get.return_value = mock_response
+        
+        other_feed_config = dict(self.feed_config, name='Ocean Science', issn='1812-0792')
+        result = self.parser.parse_feeds([self.feed_config, other_feed_config])
+        
+        self.assertEqual(len(result), 2)
+        self.assertEqual(result[0][0]['journal'], 'JGR Oceans')
+        self.assertEqual(result[1][0]['journal'], 'Ocean Science')
+
+    @patch('requests.Session.get')
+    def test_parse_feed_not_modified(self, mock_get):
+        """Test that a 304 response reuses the cached body."""
+        body = json.dumps({'message': {'items': [self.crossref_item]}})
+        
+        first_response = MagicMock(status_code=200, headers={'ETag': '"abc"'}, text=body,
+                                   content=body.encode())
+        second_response = MagicMock(status_code=304)
+        mock_get.side_effect = [first_response, second_response]
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = FeedCache(os.path.join(tmp_dir, 'cache.db'))
+            parser = FeedParser(config=self.stub_config, cache=cache)
+            
+            first = parser.parse_feed(self.feed_config)
+            second = parser.parse_feed(self.feed_config)
+            cache.close()
+        
+        # The second request is conditional and served from the cache
+        self.assertEqual(mock_get.call_args[1]['headers']['If-None-Match'], '"abc"')
+        second_response.raise_for_status.assert_not_called()
+        self.assertEqual(second, first)
+        self.assertEqual(len(second), 1)
+
+    @patch('litlum.feeds.parser.ROWS_PER_PAGE', 1)
+    @patch('requests.Session.get')
+    def test_parse_feed_not_modified_stops_paging(self, mock_get):
+        """Test that the cached next-cursor is not followed after a 304 response."""
+        body = json.dumps({'message': {'items': [self.crossref_item], 'next-cursor': 'stale'}})
+        
+        first_response = MagicMock(status_code=200, headers={'ETag': '"abc"'}, text=body,
+                                   content=body.encode())
+        empty_page = MagicMock(status_code=200, headers={}, content=b'{"message": {"items": []}}')
+        mock_get.side_effect = [first_response, empty_page, MagicMock(status_code=304)]
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = FeedCache(os.path.join(tmp_dir, 'cache.db'))
+            parser = FeedParser(config=self.stub_config, cache=cache)
+            parser.parse_feed(self.feed_config)
+            second = parser.parse_feed(self.feed_config)
+            cache.close()
+        
+        self.assertEqual(len(second), 1)
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(mock_get.call_args[1]['params']['cursor'], '*')
+
+    @patch('litlum.feeds.parser.ROWS_PER_PAGE', 1)
+    @patch('requests.Session.get')
+    def test_parse_feed_incomplete_not_cached(self, mock_get):
+        """Test that a first page is not cached when a later page failed."""
+        second_item = dict(self.crossref_item, DOI='10.1029/2024jc021999')
+        body = json.dumps({'message': {'items': [self.crossref_item], 'next-cursor': 'abc'}})
+        first_page = MagicMock(status_code=200, headers={'ETag': '"abc"'}, text=body,
+                               content=body.encode())
+        last_page = MagicMock(status_code=200, headers={}, content=json.dumps({
+            'message': {'items': [second_item]}
+        }).encode())
+        mock_get.side_effect = [first_page, Exception("Timeout"), first_page, last_page]
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = FeedCache(os.path.join(tmp_dir, 'cache.db'))
+            parser = FeedParser(config=self.stub_config, cache=cache)
+            first = parser.parse_feed(self.feed_config)
+            second = parser.parse_feed(self.feed_config)
+            cache.close()
+        
+        self.assertEqual([p['doi'] for p in first], ['10.1029/2024jc021997'])
+        # The retry is unconditional, so the missing page is fetched
+        self.assertNotIn('If-None-Match', mock_get.call_args_list[2][1]['headers'])
+        self.assertEqual([p['doi'] for p in second], ['10.1029/2024jc021997', '10.1029/2024jc021999'])
+
+    @patch('litlum.feeds.parser.ROWS_PER_PAGE', 1)
+    @patch('requests.Session.get')
+    def test_parse_feed_pagination(self, mock_get):
+        """Test following CrossRef's next-cursor until a short page is returned."""
+        second_item = dict(self.crossref_item, DOI='10.1029/2024jc021999')
+        full_page = MagicMock(content=json.dumps({
+            'message': {'items': [self.crossref_item], 'next-cursor': 'abc+def'}
+        }).encode())
+        last_page = MagicMock(content=json.dumps({
+            'message': {'items': [second_item], 'next-cursor': 'ghi'}
+        }).encode())
+        empty_page = MagicMock(content=json.dumps({
+            'message': {'items': []}
+        }).encode())
+        mock_get.side_effect = [full_page, last_page, empty_page]
+        
+        result = self.parser.parse_feed(self.feed_config)
+        
+        self.assertEqual([p['doi'] for p in result], ['10.1029/2024jc021997', '10.1029/2024jc021999'])
+        self.assertEqual(mock_get.call_args_list[1][1]['params']['cursor'], 'abc+def')
+        self.assertEqual(mock_get.call_count, 3)
+
+    @patch('litlum.feeds.parser.ROWS_PER_PAGE', 1)
+    @patch('requests.Session.get')
+    def test_parse_feed_keeps_pages_before_error(self, mock_get):
+        """Test that a failing later page keeps the publications already fetched."""
+        full_page = MagicMock(content=json.dumps({
+            'message': {'items': [self.crossref_item], 'next-cursor': 'abc'}
+        }).encode())
+        mock_get.side_effect = [full_page, Exception("API error")]
+        
+        result = self.parser.parse_feed(self.feed_config)
+        
+        self.assertEqual([p['doi'] for p in result], ['10.1029/2024jc021997'])
+
     def test_missing_issn(self):
         """Test handling of missing ISSN in feed configuration."""
         # Create a feed config with missing ISSN
@@ -170,26 +310,24 @@ class TestFeedParser(unittest.TestCase):
         # Should be filtered out
         self.assertIsNone(result)
         
-    @patch('requests.get')
-    @patch('litlum.feeds.parser.Config')
-    def test_custom_days_range(self, mock_config, mock_get):
-        """Test that days_range parameter is used correctly."""
-        # Mock the config to return a specific days_range
-        mock_config_instance = MagicMock()
-        mock_config_instance._config = {
-            'crossref': {
-                'days_range': 10
-            }
-        }
-        mock_config.return_value = mock_config_instance
+    def test_known_guid_skipped(self):
+        """Test that publications already stored are skipped."""
+        self.parser.known_guids = {'crossref-10.1029/2024jc021997'}
+        
+        result = self.parser._extract_publication_data(self.crossref_item, 'JGR Oceans')
         
+        self.assertIsNone(result)
+
+    @patch('requests.Session.get')
+    def test_custom_days_range(self, mock_get):
+        """Test that days_range parameter is used correctly."""
         # Create a mock response
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             'message': {
                 'items': [self.crossref_item]
             }
-        }
+        }).encode()
         mock_get.return_value = mock_response
         
         # Create a feed config with custom days_range that overrides global setting
@@ -204,20 +342,18 @@ class TestFeedParser(unittest.TestCase):
         from datetime import datetime
         test_date = datetime(2025, 5, 31)
         
-        # Initialize the parser with the fixed date
-        self.parser = FeedParser(current_date=test_date)
+        # Initialize the parser with the stub config and the fixed date
+        self.parser = FeedParser(config=self.stub_config, current_date=test_date)
         
         # Call the parse_feed method
         self.parser.parse_feed(custom_feed_config)
         
-        # Verify the URL used in the request contains the correct date range
-        called_url = mock_get.call_args[0][0]
+        # Verify the query used in the request contains the correct date range
+        called_params = mock_get.call_args[1]['params']
         # The from-pub-date should be 7 days back from 2025-05-31
-        # Since the URL parameters are encoded, we need to check the encoded value
         # Note: The implementation uses timedelta(days=days_range), which makes it exclusive of the start date
         # So for 7 days range from 2025-05-31, it should be 2025-05-24
-        encoded_param = quote('from-pub-date:2025-05-24')
-        self.assertIn(encoded_param, called_url)
+        self.assertIn('from-pub-date:2025-05-24', called_params['filter'])
 
 
 if __name__ == "__main__":
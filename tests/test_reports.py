@@ -0,0 +1,91 @@
+"""Tests for the report generator module."""
+
+import unittest
+import sys
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from rich.console import Console
+
+# Add the project root directory to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from litlum.reports.generator import ReportGenerator
+
+
+class TestReportGenerator(unittest.TestCase):
+    """Test cases for the ReportGenerator class."""
+
+    def setUp(self):
+        """Set up a report generator writing to a temporary directory."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.generator = ReportGenerator(self.tmp_dir.name, min_relevance=7)
+        
+        self.publications = [
+            {
+                'id': i,
+                'journal': 'JGR Oceans',
+                'title': f'Test Publication {i}',
+                'url': f'https://doi.org/10.1029/test{i}',
+                'relevance_score': score,
+                'llm_summary': 'Summary with ünïcode'
+            }
+            for i, score in enumerate([5, 9, 7])
+        ]
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp_dir.cleanup()
+
+    def test_generate_and_get_report(self):
+        """Test that a generated report round-trips through disk."""
+        self.generator.generate_daily_report(self.publications, '2025-05-30')
+        
+        report = self.generator.get_report('2025-05-30')
+        
+        self.assertEqual(report['date'], '2025-05-30')
+        self.assertEqual([p['id'] for p in report['publications']], [1, 2])
+        self.assertEqual(report['publications'][0]['llm_summary'], 'Summary with ünïcode')
+
+    def test_get_report_missing(self):
+        """Test that a missing report returns None."""
+        self.assertIsNone(self.generator.get_report('1999-01-01'))
+
+    def test_list_reports(self):
+        """Test that only report files are listed, newest first."""
+        self.generator.generate_daily_report(self.publications, '2025-05-29')
+        self.generator.generate_daily_report(self.publications, '2025-05-30')
+        Path(self.tmp_dir.name, 'notes.txt').write_text('not a report')
+        
+        self.assertEqual(self.generator.list_reports(), ['2025-05-30', '2025-05-29'])
+
+    def test_get_report_cached_until_rewritten(self):
+        """Test that parsed reports are reused until the file is saved again."""
+        self.generator.generate_daily_report(self.publications, '2025-05-30')
+        
+        first = self.generator.get_report('2025-05-30')
+        self.assertIs(self.generator.get_report('2025-05-30'), first)
+        
+        self.generator.generate_daily_report(self.publications[:2], '2025-05-30')
+        second = self.generator.get_report('2025-05-30')
+        
+        self.assertIsNot(second, first)
+        self.assertEqual([p['id'] for p in second['publications']], [1])
+
+    def test_display_report_applies_higher_threshold(self):
+        """Test that display filters a report generated with a lower threshold."""
+        ReportGenerator(self.tmp_dir.name, min_relevance=5).generate_daily_report(
+            self.publications, '2025-05-30'
+        )
+        output = StringIO()
+        self.generator.console = Console(file=output, width=200)
+        
+        self.generator.display_report('2025-05-30')
+        
+        self.assertIn('Test Publication 1', output.getvalue())
+        self.assertNotIn('Test Publication 0', output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
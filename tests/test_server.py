@@ -0,0 +1,53 @@
+"""Tests for the static website HTTP server."""
+
+import unittest
+import sys
+import tempfile
+import threading
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+# Add the project root directory to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from litlum.web.server import create_server
+
+
+class TestServer(unittest.TestCase):
+    """Test cases for create_server."""
+
+    def setUp(self):
+        """Start a server for a temporary directory on a free port."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.body = ("<html>" + "x" * 100000 + "</html>").encode("utf-8")
+        Path(self.tmp_dir.name, "index.html").write_bytes(self.body)
+        
+        self.httpd = create_server(self.tmp_dir.name, "localhost", 0)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        self.base_url = f"http://localhost:{self.httpd.server_address[1]}"
+
+    def tearDown(self):
+        """Stop the server and remove the temporary directory."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.tmp_dir.cleanup()
+
+    def test_serves_file_from_directory(self):
+        """Test that files are served from the web path."""
+        with urllib.request.urlopen(f"{self.base_url}/index.html") as response:
+            self.assertEqual(response.status, 200)
+            self.assertEqual(response.headers["Content-Length"], str(len(self.body)))
+            self.assertEqual(response.read(), self.body)
+
+    def test_missing_file(self):
+        """Test that missing files return 404."""
+        with self.assertRaises(urllib.error.HTTPError) as ctx:
+            urllib.request.urlopen(f"{self.base_url}/missing.html")
+        
+        self.assertEqual(ctx.exception.code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
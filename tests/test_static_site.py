@@ -0,0 +1,115 @@
+"""Tests for the static site generator module."""
+
+import unittest
+import os
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+# Add the project root directory to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from litlum.reports.generator import ReportGenerator
+from litlum.web.static_site_generator import StaticSiteGenerator
+
+
+class TestStaticSiteGenerator(unittest.TestCase):
+    """Test cases for the StaticSiteGenerator class."""
+
+    def setUp(self):
+        """Write a report and set up a generator for a temporary site."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.reports_path = Path(self.tmp_dir.name, "reports")
+        self.output_path = Path(self.tmp_dir.name, "web")
+        
+        self.publications = [
+            {
+                'id': 1,
+                'journal': 'JGR Oceans',
+                'title': 'Ocean Mixing',
+                'url': 'https://doi.org/10.1029/test1',
+                'relevance_score': 9,
+                'llm_summary': 'A relevant summary',
+                'abstract': 'An abstract'
+            }
+        ]
+        ReportGenerator(str(self.reports_path)).generate_daily_report(self.publications, "2025-05-30")
+        
+        self.generator = StaticSiteGenerator(str(self.reports_path), str(self.output_path))
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.tmp_dir.cleanup()
+
+    def test_generate_site(self):
+        """Test that the index and report pages are written."""
+        self.generator.generate_site()
+        
+        index = (self.output_path / "index.html").read_text(encoding="utf-8")
+        self.assertIn('href="report_2025-05-30.html"', index)
+        self.assertIn("1 publications", index)
+        self.assertNotIn("${", index)
+        
+        page = (self.output_path / "report_2025-05-30.html").read_text(encoding="utf-8")
+        self.assertIn("<title>Report - May 30, 2025 - LitLum</title>", page)
+        self.assertIn("<h2>Report: May 30, 2025</h2>", page)
+        self.assertIn("Ocean Mixing", page)
+        self.assertIn("<p>Found 1 publications", page)
+        self.assertIn("A relevant summary", page)
+        self.assertNotIn("${", page)
+
+    def test_publication_fields_escaped(self):
+        """Test that markup in publication fields is escaped."""
+        self.publications[0]['title'] = 'Heat & <i>Salt</i> "Fluxes"'
+        ReportGenerator(str(self.reports_path)).generate_daily_report(self.publications, "2025-05-30")
+        
+        self.generator.generate_site()
+        
+        page = (self.output_path / "report_2025-05-30.html").read_text(encoding="utf-8")
+        self.assertIn("Heat &amp; &lt;i&gt;Salt&lt;/i&gt; &quot;Fluxes&quot;", page)
+        self.assertNotIn("<i>Salt</i>", page)
+
+    def test_abstract_markup_stripped(self):
+        """Test that JATS markup in stored abstracts is removed rather than escaped."""
+        self.publications[0]['abstract'] = '<jats:title>Abstract</jats:title><jats:p>Ocean &amp; ice.</jats:p>'
+        ReportGenerator(str(self.reports_path)).generate_daily_report(self.publications, "2025-05-30")
+        
+        self.generator.generate_site()
+        
+        page = (self.output_path / "report_2025-05-30.html").read_text(encoding="utf-8")
+        self.assertIn("<p>Ocean &amp; ice.</p>", page)
+        self.assertNotIn("jats", page)
+
+    def test_assets_copied(self):
+        """Test that assets are copied and left alone when unchanged."""
+        self.generator.generate_site()
+        css = self.output_path / "assets" / "styles.css"
+        source = Path(self.generator.assets_dir, "styles.css")
+        self.assertEqual(css.read_bytes(), source.read_bytes())
+        
+        with patch("litlum.web.static_site_generator.shutil.copy2") as mock_copy:
+            self.generator.generate_site()
+        
+        mock_copy.assert_not_called()
+
+    def test_unchanged_report_pages_skipped(self):
+        """Test that report pages are only regenerated when their report changes."""
+        self.generator.generate_site()
+        
+        with patch.object(self.generator, "_generate_report_page") as mock_page:
+            self.generator.generate_site()
+        mock_page.assert_not_called()
+        
+        # Make the report newer than its page
+        report_file = self.reports_path / "report_2025-05-30.json"
+        page_mtime = (self.output_path / "report_2025-05-30.html").stat().st_mtime_ns
+        os.utime(report_file, ns=(page_mtime + 10**9, page_mtime + 10**9))
+        
+        with patch.object(self.generator, "_generate_report_page") as mock_page:
+            self.generator.generate_site()
+        mock_page.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
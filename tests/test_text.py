@@ -0,0 +1,43 @@
+"""Tests for the shared text helpers."""
+
+import unittest
+import sys
+from pathlib import Path
+
+# Add the project root directory to the Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from litlum.text import clean_abstract
+
+
+class TestCleanAbstract(unittest.TestCase):
+    """Test cases for clean_abstract."""
+
+    def test_jats_markup_removed(self):
+        """Test that JATS markup and the leading title are stripped."""
+        abstract = (
+            '<jats:title>Abstract</jats:title>\n<jats:p>Rising <jats:italic>CO</jats:italic>'
+            '<jats:sub>2</jats:sub> &amp; warming.</jats:p><jats:p>Second  paragraph.</jats:p>'
+        )
+        
+        self.assertEqual(clean_abstract(abstract), 'Rising CO2 & warming. Second paragraph.')
+
+    def test_tags_with_attributes_removed(self):
+        """Test that tags with attributes and HTML tags are stripped."""
+        abstract = '<jats:sec id="s1"><p>Sea <i>ice</i><br/>loss</p></jats:sec>'
+        
+        self.assertEqual(clean_abstract(abstract), 'Sea ice loss')
+
+    def test_comparisons_kept(self):
+        """Test that text resembling tags is not dropped."""
+        self.assertEqual(clean_abstract('x<y and z>w'), 'x<y and z>w')
+        self.assertEqual(clean_abstract('a<b and c>d'), 'a<b and c>d')
+        self.assertEqual(clean_abstract('p < 0.05'), 'p < 0.05')
+
+    def test_plain_text_unchanged(self):
+        """Test that plain text only has its whitespace normalized."""
+        self.assertEqual(clean_abstract('  Plain   abstract.\n'), 'Plain abstract.')
+
+
+if __name__ == "__main__":
+    unittest.main()